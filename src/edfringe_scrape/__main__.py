@@ -0,0 +1,5 @@
+"""Allow running as ``python -m edfringe_scrape``."""
+
+from .cli import cli
+
+cli()
@@ -0,0 +1,108 @@
+"""Disk cache for fetched page HTML.
+
+Rendered pages cost Scraping Dog credits and several seconds each. When
+enabled, responses are stored zlib-compressed in a small SQLite database
+keyed by URL and render mode, and reused until they are older than the
+configured TTL.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Fast compression level; rendered HTML still shrinks several-fold
+_COMPRESS_LEVEL = 1
+
+
+class ResponseCache:
+    """SQLite-backed cache of page HTML with a time-to-live.
+
+    Safe to share between threads: all access goes through one connection
+    guarded by a lock.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path
+            ttl_seconds: Age after which cached entries are ignored
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, html BLOB NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url: str, dynamic: bool) -> str:
+        """Build the cache key for a request.
+
+        Args:
+            url: Page URL
+            dynamic: Whether JavaScript rendering was enabled
+
+        Returns:
+            Cache key string
+        """
+        return f"{'dynamic' if dynamic else 'static'}:{url}"
+
+    def get(self, key: str) -> str | None:
+        """Look up a cached page.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached HTML, or None if missing or expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT html, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        body, fetched_at = row
+        if time.time() - fetched_at > self.ttl_seconds:
+            return None
+
+        logger.debug(f"Cache hit: {key}")
+        # Entries written before compression was added are plain text
+        if isinstance(body, str):
+            return body
+        return zlib.decompress(body).decode("utf-8")
+
+    def set(self, key: str, html: str) -> None:
+        """Store a fetched page.
+
+        Args:
+            key: Cache key from make_key
+            html: Page HTML
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, html, fetched_at) "
+                "VALUES (?, ?, ?)",
+                (
+                    key,
+                    zlib.compress(html.encode("utf-8"), _COMPRESS_LEVEL),
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,40 +1,49 @@
 """Command-line interface using Click."""
 
+from __future__ import annotations
+
 import logging
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import click
-import pandas as pd
-
-from .config import Settings, get_settings
-from .converter import FringeConverter, save_all_formats
-from .core import (
-    PERFORMANCE_COLUMNS,
-    SHOW_INFO_COLUMNS,
-    FringeScraper,
-    collect_venues,
-    load_canonical,
-    load_venue_cache,
-    merge_performances,
-    merge_show_info,
-    save_canonical,
-    save_snapshot_csv,
-    save_venue_cache,
-    show_info_to_dataframe,
-    shows_to_dataframe,
-)
-from .email_sender import send_email
-from .models import Genre, ScrapedShow
-from .scraper import ScrapingDogError
-from .snapshot import (
-    SnapshotDiff,
-    compare_snapshots,
-    find_latest_snapshot,
-    format_diff_as_html,
-    format_diff_as_text,
-    load_snapshot,
-)
+
+from .storage import CSV_ENGINES, OUTPUT_FORMATS, ensure_dir
+
+# Heavy modules (pandas, pydantic-settings, the scraper stack) are imported
+# inside the commands that need them so `--help` starts quickly.
+if TYPE_CHECKING:
+    import pandas as pd
+    from click._termui_impl import ProgressBar
+
+    from .config import Settings
+    from .core import FringeScraper
+    from .models import ScrapedShow, VenueInfo
+    from .snapshot import SnapshotDiff
+
+T = TypeVar("T")
+V = TypeVar("V")
+
+# Progress bars redraw at most this many times over a run
+_PROGRESS_REDRAWS = 200
+
+# Redraw interval for bars whose total is not known up front
+_UNKNOWN_LENGTH_MIN_STEPS = 10
+
+
+def _get_settings(ctx: click.Context) -> Settings:
+    """Get settings for a command, loading them on first use.
+
+    Settings are not loaded by the group callback, so commands that never
+    read them (e.g. compare) skip environment parsing entirely.
+    """
+    if "settings" not in ctx.obj:
+        from .config import get_settings
+
+        ctx.obj["settings"] = get_settings()
+    return ctx.obj["settings"]
 
 
 def setup_logging(verbose: int) -> None:
@@ -51,6 +60,35 @@ def setup_logging(verbose: int) -> None:
     )
 
 
+def _progressbar(
+    label: str, length: int | None = None, iterable: Iterable[V] | None = None
+) -> ProgressBar[V]:
+    """Create a progress bar that redraws only every few updates.
+
+    Bars of known length redraw at most _PROGRESS_REDRAWS times; bars
+    without one redraw every _UNKNOWN_LENGTH_MIN_STEPS updates.
+
+    Args:
+        label: Label shown before the bar
+        length: Total number of steps, if known
+        iterable: Items to iterate over (instead of calling update())
+
+    Returns:
+        Click progress bar (use as a context manager)
+    """
+    return click.progressbar(
+        iterable,
+        length=length,
+        label=label,
+        show_pos=True,
+        update_min_steps=(
+            max(1, length // _PROGRESS_REDRAWS)
+            if length
+            else _UNKNOWN_LENGTH_MIN_STEPS
+        ),
+    )
+
+
 def _scrape_all_genres(
     scraper: FringeScraper,
     genre_list: list[str],
@@ -58,58 +96,69 @@ def _scrape_all_genres(
     scrape_start_time: datetime,
     max_shows: int | None,
     recently_added: str | None,
-) -> tuple[list[pd.DataFrame], list[pd.DataFrame], list[ScrapedShow]]:
-    """Scrape all genres, returning performance DFs, info DFs, and shows."""
-    all_perf_dfs: list[pd.DataFrame] = []
-    all_info_dfs: list[pd.DataFrame] = []
-    all_shows: list[ScrapedShow] = []
+    concurrency: int = 1,
+) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, VenueInfo]]:
+    """Scrape all genres, returning performance and info DFs, and venues.
+
+    Each genre's performances are appended to shared column lists and
+    converted to one performance DataFrame and one show-info DataFrame at
+    the end, rather than building a DataFrame per genre and concatenating
+    them.
+    """
+    from itertools import chain
+
+    import pandas as pd
+
+    from .core import (
+        SHOW_INFO_COLUMNS,
+        collect_venues,
+        performance_columns,
+        search_url,
+        show_info_to_dataframe,
+    )
+    from .models import GENRES_BY_VALUE
+    from .scraper import ScrapingDogError
+
+    columns: dict[str, list[str]] = {}
+    scraped: list[list[ScrapedShow]] = []
+    all_venues: dict[str, VenueInfo] = {}
 
     for genre_str in genre_list:
-        genre_enum = Genre(genre_str)
+        genre_enum = GENRES_BY_VALUE[genre_str]
+        source_url = search_url(settings.base_url, genre_enum)
         click.echo(f"Scraping {genre_enum.value}...")
 
         try:
-            show_cards = list(
-                scraper.fetch_all_search_results(
-                    genre_enum, max_shows, recently_added=recently_added
-                )
+            # Cards go straight from the search pages into the detail
+            # fetcher, so details download while later pages are listed
+            show_cards = scraper.fetch_all_search_results(
+                genre_enum, max_shows, recently_added=recently_added
             )
-            click.echo(f"  Found {len(show_cards)} shows")
-
-            if show_cards:
-                click.echo("  Fetching details...")
-                shows: list[ScrapedShow] = []
-                with click.progressbar(
-                    show_cards,
-                    label="  Processing",
-                    show_pos=True,
-                    item_show_func=lambda c: c.title[:30] if c else "",
-                ) as cards:
-                    for card in cards:
-                        show = scraper.fetch_show_with_details(
-                            card, genre_enum
-                        )
-                        shows.append(show)
-
-                all_shows.extend(shows)
-
-                source_url = (
-                    f"{settings.base_url}/tickets/whats-on"
-                    f"?search=true&genres={genre_str}"
-                )
-                perf_df = shows_to_dataframe(
-                    shows,
-                    source_url=source_url,
-                    scrape_time=scrape_start_time,
+            details = scraper.fetch_shows_with_details(
+                show_cards, genre_enum, max_workers=concurrency
+            )
+            results: dict[int, ScrapedShow] = {}
+            with _progressbar("  Processing", iterable=details) as bar:
+                for idx, show in bar:
+                    results[idx] = show
+            # Restore search-result order; fetches complete out of order
+            shows = [results[idx] for idx in sorted(results)]
+
+            if not shows:
+                click.echo("  No shows found")
+            else:
+                for code, venue in collect_venues(shows).items():
+                    all_venues.setdefault(code, venue)
+                scraped.append(shows)
+
+                first_row = len(columns.get("date", []))
+                performance_columns(
+                    shows, source_url, scrape_start_time, genre=genre_str,
+                    into=columns,
                 )
-                perf_df["genre"] = genre_str
-                all_perf_dfs.append(perf_df)
-
-                info_df = show_info_to_dataframe(shows)
-                if not info_df.empty:
-                    all_info_dfs.append(info_df)
-
-                perf_count = sum(len(s.performances) for s in shows)
+                # Shows without performances still get one row with no date
+                genre_dates = columns["date"][first_row:]
+                perf_count = len(genre_dates) - genre_dates.count("")
                 click.echo(
                     f"  {len(shows)} shows, {perf_count} performances"
                 )
@@ -121,32 +170,51 @@ def _scrape_all_genres(
 
         click.echo("")
 
-    return all_perf_dfs, all_info_dfs, all_shows
+    perf_df = pd.DataFrame(columns)
+    info_df = show_info_to_dataframe(chain.from_iterable(scraped))
+    if info_df.empty:
+        info_df = pd.DataFrame(columns=SHOW_INFO_COLUMNS)
+    return perf_df, info_df, all_venues
 
 
 def _save_snapshot(
-    perf_dfs: list[pd.DataFrame],
-    info_dfs: list[pd.DataFrame],
+    combined_perf: pd.DataFrame,
+    combined_info: pd.DataFrame,
     snapshot_dir: Path,
     date_str: str,
     mode_label: str,
+    csv_engine: str = "pandas",
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Concatenate and save timestamped snapshot files. Returns combined DFs."""
-    combined_perf = pd.concat(perf_dfs, ignore_index=True)
+    """Save timestamped snapshot files. Returns the saved DFs.
+
+    The returned performance frame holds its repetitive columns as
+    categoricals.
+    """
+    from .core import PERFORMANCE_CATEGORY_COLUMNS, save_snapshot_csv
+    from .snapshot import write_snapshot_digest
+
     perf_path = save_snapshot_csv(
-        combined_perf, snapshot_dir, date_str, mode_label, "snapshot"
+        combined_perf, snapshot_dir, date_str, mode_label, "snapshot",
+        csv_engine=csv_engine,
     )
+    write_snapshot_digest(combined_perf, perf_path)
     click.echo(f"Saved snapshot: {perf_path}")
     click.echo(f"  Total: {len(combined_perf)} performances")
 
-    combined_info = (
-        pd.concat(info_dfs, ignore_index=True)
-        if info_dfs
-        else pd.DataFrame(columns=SHOW_INFO_COLUMNS)
+    # Categories are applied after writing so file output is unaffected;
+    # the combined frame is kept for the rest of update (merge, compare)
+    combined_perf = combined_perf.astype(
+        {
+            col: "category"
+            for col in PERFORMANCE_CATEGORY_COLUMNS
+            if col in combined_perf.columns
+        }
     )
+
     if not combined_info.empty:
         info_path = save_snapshot_csv(
-            combined_info, snapshot_dir, date_str, mode_label, "show-info"
+            combined_info, snapshot_dir, date_str, mode_label, "show-info",
+            csv_engine=csv_engine,
         )
         click.echo(f"Saved show info: {info_path} ({len(combined_info)} shows)")
 
@@ -155,65 +223,28 @@ def _save_snapshot(
 
 def _update_venue_cache(
     scraper: FringeScraper,
-    all_shows: list[ScrapedShow],
+    scraped_venues: dict[str, VenueInfo],
     cache_dir: Path,
+    concurrency: int = 1,
 ) -> None:
     """Fetch new venue details and update the venue cache."""
+    from .core import load_venue_cache, save_venue_cache
+
     venue_cache_path = cache_dir / "venue-info.csv"
-    scraped_venues = collect_venues(all_shows)
     cached_venues = load_venue_cache(venue_cache_path)
-    cached_codes = set(cached_venues.keys())
-    new_codes = set(scraped_venues.keys()) - cached_codes
+    new_codes = scraped_venues.keys() - cached_venues.keys()
 
     if new_codes:
         click.echo(
             f"\nFetching venue details for {len(new_codes)} new venues..."
         )
-        new_venues = {
-            c: v for c, v in scraped_venues.items() if c in new_codes
-        }
-        with click.progressbar(
-            list(new_venues.keys()),
-            label="  Venues",
-            show_pos=True,
-            item_show_func=lambda c: (
-                new_venues[c].venue_name[:30] if c and c in new_venues else ""
-            ),
-        ) as codes:
-            for code in codes:
-                venue = new_venues[code]
-                if venue.venue_page_url:
-                    try:
-                        response = scraper.client.fetch_page(
-                            venue.venue_page_url, dynamic=True
-                        )
-                        from .parser import NextDataParser
-
-                        venue_page_data = (
-                            NextDataParser.extract_venue_page_data(
-                                response.html
-                            )
-                        )
-                        if venue_page_data:
-                            phone, email_addr = (
-                                NextDataParser.parse_venue_contact(
-                                    venue_page_data
-                                )
-                            )
-                            new_venues[code] = venue.model_copy(
-                                update={
-                                    "contact_phone": phone,
-                                    "contact_email": email_addr,
-                                }
-                            )
-                    except Exception:
-                        pass
-
-        cached_venues.update(new_venues)
-    else:
-        for code, venue in scraped_venues.items():
-            if code not in cached_venues:
-                cached_venues[code] = venue
+        new_venues = [scraped_venues[c] for c in new_codes]
+        with _progressbar("  Venues", length=len(new_venues)) as bar:
+            for venue in scraper.iter_venue_contacts(
+                new_venues, max_workers=concurrency
+            ):
+                cached_venues[venue.venue_code] = venue
+                bar.update(1)
 
     save_venue_cache(cached_venues, venue_cache_path)
     click.echo(
@@ -225,17 +256,26 @@ def _compare_with_previous(
     snapshot_dir: Path,
     date_str: str,
     current_df: pd.DataFrame,
-) -> SnapshotDiff | None:
-    """Find previous snapshot, compare, and print report."""
+) -> tuple[SnapshotDiff, str] | None:
+    """Find previous snapshot, compare, and print report.
+
+    Returns the diff and its text report, so the report can be reused
+    (e.g. as the email body) without formatting it again.
+    """
+    from .snapshot import (
+        compare_with_snapshot_file,
+        find_latest_snapshot,
+        format_diff_as_text,
+    )
+
     prev_snapshot = find_latest_snapshot(snapshot_dir, exclude_date=date_str)
     if prev_snapshot:
         click.echo(f"Comparing with: {prev_snapshot.name}")
-        prev_df = load_snapshot(prev_snapshot)
-        diff = compare_snapshots(prev_df, current_df)
+        diff = compare_with_snapshot_file(prev_snapshot, current_df)
         text_report = format_diff_as_text(diff)
         click.echo("")
         click.echo(text_report)
-        return diff
+        return diff, text_report
     click.echo("No previous snapshot found for comparison.")
     return None
 
@@ -244,8 +284,15 @@ def _send_update_email(
     settings: Settings,
     diff: SnapshotDiff,
     date_str: str,
+    text_body: str,
 ) -> None:
-    """Send email with comparison report."""
+    """Send email with comparison report.
+
+    text_body is the already formatted text report for diff.
+    """
+    from .email_sender import send_email
+    from .snapshot import format_diff_as_html
+
     if not settings.email_to:
         click.echo(
             "Email recipient not configured (EDFRINGE_EMAIL_TO)", err=True
@@ -262,7 +309,6 @@ def _send_update_email(
     else:
         subject += " (No changes)"
 
-    text_body = format_diff_as_text(diff)
     html_body = format_diff_as_html(diff)
 
     success = send_email(
@@ -289,7 +335,6 @@ def _send_update_email(
 def cli(ctx: click.Context, verbose: int) -> None:
     """Scrapes show, performer and performance listings from the Edinburgh Fringe website."""
     ctx.ensure_object(dict)
-    ctx.obj["settings"] = get_settings()
     ctx.obj["verbose"] = verbose
     setup_logging(verbose)
 
@@ -298,21 +343,25 @@ def cli(ctx: click.Context, verbose: int) -> None:
 @click.pass_context
 def info(ctx: click.Context) -> None:
     """Show configuration information."""
-    settings = ctx.obj["settings"]
-    click.echo(f"Debug mode: {settings.debug}")
-    click.echo(f"Log level: {settings.log_level}")
-    click.echo(f"Base URL: {settings.base_url}")
-    click.echo(f"Output dir: {settings.output_dir}")
-    click.echo(f"Request delay: {settings.request_delay_ms}ms")
-    click.echo(f"JS wait time: {settings.js_wait_ms}ms")
-    click.echo(f"Default year: {settings.default_year}")
+    settings = _get_settings(ctx)
+    lines = [
+        f"Debug mode: {settings.debug}",
+        f"Log level: {settings.log_level}",
+        f"Base URL: {settings.base_url}",
+        f"Output dir: {settings.output_dir}",
+        f"Request delay: {settings.request_delay_ms}ms",
+        f"JS wait time: {settings.js_wait_ms}ms",
+        f"Default year: {settings.default_year}",
+    ]
 
     if settings.scrapingdog_api_key:
         key_preview = settings.scrapingdog_api_key[:8] + "..."
-        click.echo(f"Scraping Dog API key: {key_preview} (configured)")
+        lines.append(f"Scraping Dog API key: {key_preview} (configured)")
     else:
-        click.echo("Scraping Dog API key: NOT CONFIGURED")
-        click.echo("  Set EDFRINGE_SCRAPINGDOG_API_KEY or configure in .envrc")
+        lines.append("Scraping Dog API key: NOT CONFIGURED")
+        lines.append("  Set EDFRINGE_SCRAPINGDOG_API_KEY or configure in .envrc")
+
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -351,6 +400,24 @@ def info(ctx: click.Context) -> None:
     default=None,
     help="Override base output directory",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Concurrent show detail fetches (default: from settings)",
+)
+@click.option(
+    "--cache-ttl",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Reuse fetched pages younger than this many hours (default: from settings)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Fetch every page from the API, ignoring the page cache",
+)
 @click.pass_context
 def update(
     ctx: click.Context,
@@ -360,6 +427,9 @@ def update(
     compare: bool,
     email: bool,
     output: Path | None,
+    concurrency: int | None,
+    cache_ttl: float | None,
+    no_cache: bool,
 ) -> None:
     """Update Fringe data: scrape, snapshot, merge canonical, compare.
 
@@ -375,9 +445,26 @@ def update(
 
         edfringe-scrape update -g COMEDY --max-shows 5 --no-compare
 
-        edfringe-scrape update --email
+        edfringe-scrape update --email --cache-ttl 12
     """
-    settings = ctx.obj["settings"]
+    import pandas as pd
+
+    from .core import (
+        PERFORMANCE_COLUMNS,
+        SHOW_INFO_COLUMNS,
+        FringeScraper,
+        load_canonical,
+        merge_performances,
+        merge_show_info,
+        save_canonical,
+    )
+    from .models import GENRE_VALUES, GENRES_BY_VALUE
+
+    settings = _get_settings(ctx)
+    if no_cache:
+        cache_ttl = 0
+    if cache_ttl is not None:
+        settings = settings.model_copy(update={"response_cache_ttl_hours": cache_ttl})
 
     if not settings.scrapingdog_api_key:
         raise click.ClickException(
@@ -387,11 +474,10 @@ def update(
         )
 
     genre_list = [g.strip().upper() for g in genres.split(",")]
-    valid_genres = [g.value for g in Genre]
     for g in genre_list:
-        if g not in valid_genres:
+        if g not in GENRES_BY_VALUE:
             raise click.ClickException(
-                f"Invalid genre: {g}. Valid genres: {', '.join(valid_genres)}"
+                f"Invalid genre: {g}. Valid genres: {', '.join(GENRE_VALUES)}"
             )
 
     snapshot_dir = (output / "snapshots") if output else Path(settings.snapshot_dir)
@@ -402,68 +488,123 @@ def update(
     scrape_start_time = datetime.now()
     date_str = scrape_start_time.strftime("%Y-%m-%d")
 
-    click.echo("Edinburgh Fringe Update")
-    click.echo(f"  Mode: {mode_label}")
-    click.echo(f"  Genres: {', '.join(genre_list)}")
+    lines = [
+        "Edinburgh Fringe Update",
+        f"  Mode: {mode_label}",
+        f"  Genres: {', '.join(genre_list)}",
+    ]
     if max_shows:
-        click.echo(f"  Max shows per genre: {max_shows}")
-    click.echo("")
+        lines.append(f"  Max shows per genre: {max_shows}")
+    lines.append("")
+    click.echo("\n".join(lines))
+
+    with FringeScraper(settings) as scraper:
+        # 1. Scrape all genres
+        new_perf_df, new_info_df, scraped_venues = _scrape_all_genres(
+            scraper, genre_list, settings, scrape_start_time,
+            max_shows, recently_added,
+            concurrency or settings.scrape_concurrency,
+        )
+        if new_perf_df.empty:
+            click.echo("No data scraped!")
+            return
+
+        # 2. Save timestamped snapshot
+        new_perf_df, new_info_df = _save_snapshot(
+            new_perf_df, new_info_df, snapshot_dir, date_str, mode_label,
+            settings.snapshot_csv_engine,
+        )
 
-    scraper = FringeScraper(settings)
+        # 3. Merge into canonical files
+        ensure_dir(current_dir)
+        perf_path = current_dir / "performances.csv"
+        info_path = current_dir / "show-info.csv"
 
-    # 1. Scrape all genres
-    all_perf_dfs, all_info_dfs, all_shows = _scrape_all_genres(
-        scraper, genre_list, settings, scrape_start_time,
-        max_shows, recently_added,
-    )
-    if not all_perf_dfs:
-        click.echo("No data scraped!")
-        return
+        # Full mode replaces every scraped genre, so skip those rows on load
+        replaced_genres = (
+            set(new_perf_df["genre"].dropna().unique()) if full else None
+        )
+        existing_perf = load_canonical(
+            perf_path, PERFORMANCE_COLUMNS, exclude_genres=replaced_genres
+        )
+        merged_perf = merge_performances(existing_perf, new_perf_df, full_mode=full)
+        del existing_perf
+        save_canonical(merged_perf, perf_path)
+        perf_total = len(merged_perf)
+        del merged_perf
+
+        if new_info_df.empty and info_path.exists():
+            # Nothing to merge: leave the file as is and only count its rows
+            info_total = len(pd.read_csv(info_path, usecols=["show-link-href"]))
+        else:
+            existing_info = load_canonical(info_path, SHOW_INFO_COLUMNS)
+            merged_info = merge_show_info(existing_info, new_info_df)
+            save_canonical(merged_info, info_path)
+            info_total = len(merged_info)
 
-    # 2. Save timestamped snapshot
-    new_perf_df, new_info_df = _save_snapshot(
-        all_perf_dfs, all_info_dfs, snapshot_dir, date_str, mode_label,
-    )
+        click.echo(
+            f"Performances: {perf_total} total "
+            f"({len(new_perf_df)} new/updated)"
+        )
+        click.echo(
+            f"Shows: {info_total} total ({len(new_info_df)} new/updated)"
+        )
 
-    # 3. Merge into canonical files
-    current_dir.mkdir(parents=True, exist_ok=True)
-    perf_path = current_dir / "performances.csv"
-    info_path = current_dir / "show-info.csv"
+        # 4. Update venue cache
+        _update_venue_cache(
+            scraper, scraped_venues, current_dir,
+            concurrency or settings.scrape_concurrency,
+        )
 
-    existing_perf = load_canonical(perf_path, PERFORMANCE_COLUMNS)
-    existing_info = load_canonical(info_path, SHOW_INFO_COLUMNS)
+    click.echo("")
 
-    merged_perf = merge_performances(existing_perf, new_perf_df, full_mode=full)
-    merged_info = merge_show_info(existing_info, new_info_df)
+    # 5. Compare with previous snapshot
+    comparison = None
+    if compare:
+        comparison = _compare_with_previous(snapshot_dir, date_str, new_perf_df)
 
-    save_canonical(merged_perf, perf_path)
-    save_canonical(merged_info, info_path)
+    # 6. Email report
+    if email and comparison:
+        diff, text_report = comparison
+        _send_update_email(settings, diff, date_str, text_report)
 
-    click.echo(
-        f"Performances: {len(merged_perf)} total "
-        f"({len(new_perf_df)} new/updated)"
-    )
-    click.echo(
-        f"Shows: {len(merged_info)} total ({len(new_info_df)} new/updated)"
-    )
 
-    # 4. Update venue cache
-    _update_venue_cache(scraper, all_shows, current_dir)
+def _map_files(
+    func: Callable[..., T], arg_tuples: list[tuple[Any, ...]], jobs: int
+) -> Iterator[T]:
+    """Apply func to each argument tuple, using worker processes if jobs > 1.
 
-    click.echo("")
+    Args:
+        func: Module-level (picklable) worker function
+        arg_tuples: One tuple of positional arguments per file
+        jobs: Maximum number of worker processes
 
-    # 5. Compare with previous snapshot
-    diff = None
-    if compare:
-        diff = _compare_with_previous(snapshot_dir, date_str, new_perf_df)
+    Yields:
+        Results in the same order as arg_tuples
+    """
+    if jobs == 1 or len(arg_tuples) == 1:
+        for args in arg_tuples:
+            yield func(*args)
+        return
 
-    # 6. Email report
-    if email and diff:
-        _send_update_email(settings, diff, date_str)
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # spawn rather than fork: pandas/pyarrow may already have threads running
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(arg_tuples)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        yield from pool.map(func, *zip(*arg_tuples, strict=True))
 
 
 @cli.command()
-@click.argument("input_file", type=click.Path(exists=True, path_type=Path))
+@click.argument(
+    "input_files",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+)
 @click.option(
     "--formats",
     type=click.Choice(["all", "cleaned", "summary", "wide"]),
@@ -475,7 +616,7 @@ def update(
     "--output",
     type=click.Path(path_type=Path),
     default=None,
-    help="Output directory (default: same as input file)",
+    help="Output directory (default: same as each input file)",
 )
 @click.option(
     "--year",
@@ -483,62 +624,92 @@ def update(
     default=None,
     help="Year for date parsing (default: from settings)",
 )
+@click.option(
+    "--csv-engine",
+    type=click.Choice(CSV_ENGINES),
+    default="pandas",
+    help=(
+        "CSV writer (default: pandas). pyarrow is faster but quotes all "
+        "text fields"
+    ),
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of files to convert in parallel (default: 1)",
+)
 @click.pass_context
 def convert(
     ctx: click.Context,
-    input_file: Path,
+    input_files: tuple[Path, ...],
     formats: str,
     output: Path | None,
     year: int | None,
+    csv_engine: str,
+    jobs: int,
 ) -> None:
-    """Convert raw scraped CSV to cleaned/summary/wide formats.
+    """Convert raw scraped data to cleaned/summary/wide formats.
+
+    INPUT_FILES may be CSV, Parquet or Feather (chosen by extension).
 
     Examples:
 
         edfringe-scrape convert data/input/2025-Comedy.csv
 
         edfringe-scrape convert data/raw.csv --formats summary -o data/output
+
+        edfringe-scrape convert data/raw/*.csv --jobs 4
     """
-    settings = ctx.obj["settings"]
-    default_year = year if year else settings.default_year
+    from .converter import convert_file
 
-    output_dir = output if output else input_file.parent
-    output_dir.mkdir(parents=True, exist_ok=True)
+    settings = _get_settings(ctx)
+    default_year = year if year else settings.default_year
 
     format_list = ["cleaned", "summary", "wide"] if formats == "all" else [formats]
 
-    click.echo(f"Converting {input_file}")
-    click.echo(f"  Formats: {', '.join(format_list)}")
-    click.echo(f"  Year: {default_year}")
-
-    converter = FringeConverter(default_year=default_year)
-    df = converter.load_raw_csv(input_file)
-
-    click.echo(f"  Loaded {len(df)} rows")
-
-    base_filename = input_file.stem
-
-    results = save_all_formats(
-        df,
-        output_dir,
-        base_filename,
-        formats=format_list,
-        default_year=default_year,
+    label = input_files[0] if len(input_files) == 1 else f"{len(input_files)} files"
+    click.echo(
+        f"Converting {label}\n"
+        f"  Formats: {', '.join(format_list)}\n"
+        f"  Year: {default_year}"
     )
 
-    click.echo("\nOutput files:")
-    for fmt, path in results.items():
-        click.echo(f"  {fmt}: {path}")
+    tasks = [
+        (
+            input_file,
+            output or input_file.parent,
+            format_list,
+            default_year,
+            csv_engine,
+        )
+        for input_file in input_files
+    ]
+    for input_file, (row_count, results) in zip(
+        input_files, _map_files(convert_file, tasks, jobs), strict=True
+    ):
+        lines = [f"\n{input_file}: loaded {row_count} rows", "Output files:"]
+        lines.extend(f"  {fmt}: {path}" for fmt, path in results.items())
+        click.echo("\n".join(lines))
 
 
 @cli.command()
-@click.argument("input_file", type=click.Path(exists=True, path_type=Path))
+@click.argument(
+    "input_files",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+)
 @click.option(
     "-o",
     "--output",
     type=click.Path(path_type=Path),
     default=None,
-    help="Output file path (default: input_file with -festival-planner suffix)",
+    help=(
+        "Output file path, single input only "
+        "(default: input file with -festival-planner suffix)"
+    ),
 )
 @click.option(
     "--year",
@@ -552,13 +723,39 @@ def convert(
     default=False,
     help="Disable intelligent performer/producer/show parsing",
 )
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="csv",
+    help="Output file format (default: csv)",
+)
+@click.option(
+    "--csv-engine",
+    type=click.Choice(CSV_ENGINES),
+    default="pandas",
+    help=(
+        "CSV writer (default: pandas). pyarrow is faster but quotes all "
+        "text fields"
+    ),
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of files to export in parallel (default: 1)",
+)
 @click.pass_context
 def export(
     ctx: click.Context,
-    input_file: Path,
+    input_files: tuple[Path, ...],
     output: Path | None,
     year: int | None,
     no_smart_parsing: bool,
+    output_format: str,
+    csv_engine: str,
+    jobs: int,
 ) -> None:
     """Export scraped data to Festival Planner format.
 
@@ -577,34 +774,51 @@ def export(
         edfringe-scrape export data/raw/shows.csv -o data/festival-planner/comedy.csv
 
         edfringe-scrape export data/raw/shows.csv --no-smart-parsing
-    """
-    settings = ctx.obj["settings"]
-    default_year = year if year else settings.default_year
-    smart_parsing = not no_smart_parsing
-
-    if output is None:
-        output = input_file.with_name(
-            input_file.stem + "-festival-planner" + input_file.suffix
-        )
 
-    output.parent.mkdir(parents=True, exist_ok=True)
+        edfringe-scrape export data/raw/shows.csv --format parquet
 
-    click.echo("Exporting to Festival Planner format")
-    click.echo(f"  Input: {input_file}")
-    click.echo(f"  Output: {output}")
-    click.echo(f"  Year: {default_year}")
-    click.echo(f"  Smart parsing: {'enabled' if smart_parsing else 'disabled'}")
+        edfringe-scrape export data/raw/shows.csv --csv-engine pyarrow
 
-    converter = FringeConverter(default_year=default_year)
-    df = converter.load_raw_csv(input_file)
-
-    click.echo(f"  Loaded {len(df)} rows")
+        edfringe-scrape export data/raw/*-EdFringe-*.csv --jobs 4
+    """
+    from .converter import export_file
 
-    df_export = converter.to_festival_planner_format(df, smart_parsing=smart_parsing)
+    if output is not None and len(input_files) > 1:
+        raise click.ClickException(
+            "--output can only be used with a single input file"
+        )
 
-    df_export.to_csv(output, index=False)
+    settings = _get_settings(ctx)
+    default_year = year if year else settings.default_year
+    smart_parsing = not no_smart_parsing
 
-    click.echo(f"\nExported {len(df_export)} performances to {output}")
+    suffix = f"-festival-planner.{output_format}"
+    outputs = [
+        output or input_file.parent / (input_file.stem + suffix)
+        for input_file in input_files
+    ]
+    for path in outputs:
+        ensure_dir(path.parent)
+
+    lines = ["Exporting to Festival Planner format"]
+    lines.extend(
+        f"  {input_file} -> {path}"
+        for input_file, path in zip(input_files, outputs, strict=True)
+    )
+    lines.append(f"  Year: {default_year}")
+    lines.append(f"  Smart parsing: {'enabled' if smart_parsing else 'disabled'}")
+    click.echo("\n".join(lines))
+
+    tasks = [
+        (input_file, path, default_year, smart_parsing, output_format, csv_engine)
+        for input_file, path in zip(input_files, outputs, strict=True)
+    ]
+    for path, (row_count, export_count) in zip(
+        outputs, _map_files(export_file, tasks, jobs), strict=True
+    ):
+        click.echo(
+            f"\nLoaded {row_count} rows; exported {export_count} performances to {path}"
+        )
 
 
 @cli.command()
@@ -634,12 +848,21 @@ def compare(
 ) -> None:
     """Compare two snapshots and show differences.
 
+    Snapshots may be CSV or Parquet files.
+
     Examples:
 
         edfringe-scrape compare data/snapshots/2026-02-10.csv data/snapshots/2026-02-11.csv
 
         edfringe-scrape compare old.csv new.csv --format html -o report.html
     """
+    from .snapshot import (
+        compare_snapshots,
+        iter_diff_as_html,
+        iter_diff_as_text,
+        load_snapshot,
+    )
+
     click.echo(f"Loading {old_snapshot.name}...")
     old_df = load_snapshot(old_snapshot)
 
@@ -650,16 +873,17 @@ def compare(
     diff = compare_snapshots(old_df, new_df)
 
     if output_format == "html":
-        report = format_diff_as_html(diff)
+        report_lines = iter_diff_as_html(diff)
     else:
-        report = format_diff_as_text(diff)
+        report_lines = iter_diff_as_text(diff)
 
     if output:
-        output.write_text(report)
+        with output.open("w", encoding="utf-8") as fh:
+            fh.writelines(f"{line}\n" for line in report_lines)
         click.echo(f"Report saved to: {output}")
     else:
         click.echo("")
-        click.echo(report)
+        click.echo("\n".join(report_lines))
 
 
 if __name__ == "__main__":
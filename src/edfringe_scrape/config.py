@@ -1,5 +1,8 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import lru_cache
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -36,6 +39,11 @@ class Settings(BaseSettings):
         default=2000,
         description="Delay between requests in milliseconds",
     )
+    request_jitter_ms: int = Field(
+        default=0,
+        ge=0,
+        description="Random extra delay (0 to this many ms) added between requests",
+    )
     js_wait_ms: int = Field(
         default=15000,
         ge=0,
@@ -52,6 +60,21 @@ class Settings(BaseSettings):
         default=2026,
         description="Default year for date parsing",
     )
+    scrape_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="Number of show detail pages fetched concurrently",
+    )
+    response_cache_ttl_hours: float = Field(
+        default=0,
+        ge=0,
+        description="Reuse fetched pages younger than this many hours (0 disables)",
+    )
+    cache_dir: str = Field(
+        default="data/cache",
+        description="Directory for the fetched-page cache",
+    )
 
     # Email settings for daily updates
     email_to: str | None = Field(
@@ -84,6 +107,10 @@ class Settings(BaseSettings):
         default="data/snapshots",
         description="Directory for daily snapshots",
     )
+    snapshot_csv_engine: Literal["pandas", "pyarrow"] = Field(
+        default="pandas",
+        description="CSV writer for snapshots (pyarrow is faster, quotes all text)",
+    )
 
     # Current/canonical data settings
     current_dir: str = Field(
@@ -92,10 +119,19 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings.
 
+    Settings are read from the environment once per process; call
+    reset_settings() to pick up environment changes.
+
     Returns:
         Application settings instance
     """
     return Settings()
+
+
+def reset_settings() -> None:
+    """Discard cached settings so the next get_settings() re-reads them."""
+    get_settings.cache_clear()
@@ -7,13 +7,111 @@ Ported from convert-2025.py - transforms raw CSV data into:
 """
 
 import logging
+import re
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 
+from .storage import ensure_dir, read_frame, write_frame
+
 logger = logging.getLogger(__name__)
 
+# Scraper availability values to Festival Planner availability
+AVAILABILITY_MAP = {
+    "TICKETS_AVAILABLE": "tickets-available",
+    "TWO_FOR_ONE": "2-for-1-show",
+    "SOLD_OUT": "sold-out",
+    "CANCELLED": "cancelled",
+    "PREVIEW": "preview-show",
+    "FREE_TICKETED": "free-show",
+    "FREE": "free-show",
+    "NO_ALLOCATION": "sold-out",
+    "NO_ALLOCATION_REMAINING": "sold-out",
+}
+
+DEFAULT_AVAILABILITY = "tickets-available"
+
+# Separator between start and end in ranges like "19:30 - 20:30" or "19:30 – 20:30"
+_TIME_SEPARATOR_RE = re.compile(r"\s*[-–]\s*")
+
+# Substrings of lowercased names that mark a production company
+COMPANY_PATTERNS = (
+    " presents",
+    " present",
+    " productions",
+    " comedy",
+    " management",
+    " entertainment",
+    " ltd",
+    " limited",
+    " inc",
+    " llc",
+    " touring",
+    " theatre",
+    " theater",
+    " arts",
+    " promotions",
+    " agency",
+    " creative",
+    " media",
+    " group",
+    " collective",
+    " ensemble",
+    " worldwide",
+    " talent",
+    " live",
+    " agents",
+    " nation",
+    "free festival",
+    "free fringe",
+    "laughing horse",
+    "pleasance",
+    "gilded balloon",
+    "underbelly",
+    "assembly",
+    "summerhall",
+    "zoo",
+    "just the tonic",
+    "mick perrin",
+    "united agents",
+    "live nation",
+    "seabright",
+    "avalon",
+    "off the kerb",
+    "phil mcintyre",
+    "berk's nest",
+)
+
+# One pass over the name instead of a substring test per pattern
+_COMPANY_PATTERN_RE = re.compile("|".join(map(re.escape, COMPANY_PATTERNS)))
+
+# Leading words of a title segment that mark a subtitle, not a performer
+SUBTITLE_PATTERNS = (
+    "part ",
+    "act ",
+    "episode",
+    "chapter",
+    "volume",
+    "vol ",
+    "season",
+    "series",
+    "the ",
+    "a ",
+    "an ",
+    "live",
+    "work in progress",
+    "wip",
+    "preview",
+    "encore",
+    "returns",
+    "reloaded",
+)
+
+# Prefix match against any subtitle pattern, and the patterns as whole words
+_SUBTITLE_PREFIX_RE = re.compile("|".join(map(re.escape, SUBTITLE_PATTERNS)))
+_SUBTITLE_WORDS = frozenset(pattern.strip() for pattern in SUBTITLE_PATTERNS)
+
 
 class FringeConverter:
     """Converts raw scraped CSV data to various output formats."""
@@ -27,16 +125,20 @@ class FringeConverter:
         self.default_year = default_year
 
     def load_raw_csv(self, filepath: Path) -> pd.DataFrame:
-        """Load raw CSV file.
+        """Load raw scraped data file.
+
+        CSV, Parquet and Feather files are supported, chosen by extension.
+        For a CSV with an up-to-date Parquet sidecar, the sidecar is read;
+        otherwise every CSV column is read as text.
 
         Args:
-            filepath: Path to CSV file
+            filepath: Path to data file
 
         Returns:
             DataFrame with raw data
         """
         logger.info(f"Loading {filepath}")
-        df = pd.read_csv(filepath)
+        df = read_frame(filepath, prefer_sidecar=True, as_strings=True)
         logger.info(f"Loaded {len(df)} rows")
         return df
 
@@ -53,18 +155,12 @@ class FringeConverter:
         Returns:
             Cleaned DataFrame
         """
-        df = df.copy()
-
-        df["date_normalized"] = df["date"].apply(self._parse_date)
-        df = df.dropna(subset=["date_normalized"])
+        df = df.assign(date_normalized=self._parse_dates(df["date"])).dropna(
+            subset=["date_normalized"]
+        )
 
         if "show-link-href" in df.columns and "show-link" in df.columns:
-            df["show"] = df.apply(
-                lambda row: self._create_hyperlink(
-                    row["show-link-href"], row["show-link"]
-                ),
-                axis=1,
-            )
+            df["show"] = self._create_hyperlinks(df["show-link-href"], df["show-link"])
 
         output_cols = [
             "show",
@@ -81,12 +177,7 @@ class FringeConverter:
             output_cols.append("web-scraper-start-url")
 
         existing_cols = [c for c in output_cols if c in df.columns]
-        df_cleaned = df[existing_cols].copy()
-
-        df_cleaned["date_normalized"] = pd.to_datetime(
-            df_cleaned["date_normalized"], errors="coerce"
-        )
-        df_cleaned = df_cleaned.dropna(subset=["date_normalized"])
+        df_cleaned = df[existing_cols]
 
         logger.info(f"Cleaned data: {len(df_cleaned)} rows")
         return df_cleaned
@@ -100,28 +191,19 @@ class FringeConverter:
         Returns:
             Summary DataFrame with performance counts and date ranges
         """
-        if "show-performer" in df_cleaned.columns:
-            df_summary = (
-                df_cleaned.groupby("show-name")
-                .agg(
-                    num_performances=("date_normalized", "count"),
-                    first_date=("date_normalized", "min"),
-                    last_date=("date_normalized", "max"),
-                    performer=("show-performer", "first"),
-                )
-                .reset_index()
-            )
-        else:
-            df_summary = (
-                df_cleaned.groupby("show-name")
-                .agg(
-                    num_performances=("date_normalized", "count"),
-                    first_date=("date_normalized", "min"),
-                    last_date=("date_normalized", "max"),
-                )
-                .reset_index()
+        if "show-performer" not in df_cleaned.columns:
+            df_cleaned = df_cleaned.assign(**{"show-performer": "N/A"})
+
+        df_summary = (
+            df_cleaned.groupby("show-name")
+            .agg(
+                num_performances=("date_normalized", "count"),
+                first_date=("date_normalized", "min"),
+                last_date=("date_normalized", "max"),
+                performer=("show-performer", "first"),
             )
-            df_summary["performer"] = "N/A"
+            .reset_index()
+        )
 
         logger.info(f"Created summary: {len(df_summary)} shows")
         return df_summary
@@ -137,10 +219,10 @@ class FringeConverter:
         Returns:
             Wide-format DataFrame
         """
-        df = df_cleaned.copy()
-
-        df["date"] = df["date_normalized"].dt.strftime("%Y-%m-%d")
-        df["status"] = df.get("show-availability", "")
+        df = df_cleaned.assign(
+            date=self._format_dates(df_cleaned["date_normalized"]),
+            status=df_cleaned.get("show-availability", ""),
+        )
 
         index_cols = [
             "show-link-href",
@@ -190,6 +272,54 @@ class FringeConverter:
         except (ValueError, IndexError):
             return None
 
+    def _parse_dates(self, raw_dates: pd.Series) -> pd.Series:
+        """Parse a column of date strings like 'Wednesday 30 July'.
+
+        Vectorized equivalent of _parse_date. Performance dates repeat
+        heavily (a show runs nightly for weeks), so only the distinct values
+        are parsed and the results mapped back.
+
+        Args:
+            raw_dates: Raw date strings
+
+        Returns:
+            Second-resolution datetimes, NaT where parsing failed
+        """
+        codes, unique = pd.factorize(raw_dates)
+        parts = pd.Series(unique, dtype=object).str.split()
+        parsed = pd.DatetimeIndex(
+            pd.to_datetime(
+                parts.str[1] + " " + parts.str[2] + f" {self.default_year}",
+                format="%d %B %Y",
+                errors="coerce",
+            )
+        ).as_unit("s")
+        return pd.Series(
+            parsed.take(codes, allow_fill=True, fill_value=pd.NaT),
+            index=raw_dates.index,
+            name=raw_dates.name,
+        )
+
+    def _format_dates(self, dates: pd.Series) -> pd.Series:
+        """Format a column of datetimes as 'YYYY-MM-DD' strings.
+
+        A festival has only a few dozen distinct dates, so each is formatted
+        once and the strings mapped back to the rows.
+
+        Args:
+            dates: Datetimes
+
+        Returns:
+            ISO format date strings, missing where the date is NaT
+        """
+        codes, unique = pd.factorize(dates, use_na_sentinel=False)
+        formatted = pd.DatetimeIndex(unique).strftime("%Y-%m-%d")
+        return pd.Series(
+            formatted.take(codes),
+            index=dates.index,
+            name=dates.name,
+        )
+
     def _create_hyperlink(self, url: str, text: str) -> str:
         """Create Excel HYPERLINK formula.
 
@@ -203,6 +333,22 @@ class FringeConverter:
         safe_text = str(text).replace('"', '""')
         return f'=HYPERLINK("{url}", "{safe_text}")'
 
+    def _create_hyperlinks(self, urls: pd.Series, texts: pd.Series) -> pd.Series:
+        """Create Excel HYPERLINK formulas for whole columns.
+
+        Vectorized equivalent of _create_hyperlink. Missing values become
+        empty strings.
+
+        Args:
+            urls: Link URLs
+            texts: Display texts
+
+        Returns:
+            Excel HYPERLINK formula strings
+        """
+        safe_texts = texts.fillna("").astype(str).str.replace('"', '""')
+        return '=HYPERLINK("' + urls.fillna("").astype(str) + '", "' + safe_texts + '")'
+
     def to_festival_planner_format(
         self, df: pd.DataFrame, smart_parsing: bool = True
     ) -> pd.DataFrame:
@@ -218,51 +364,55 @@ class FringeConverter:
         Returns:
             DataFrame in Festival Planner format
         """
-        df = df.copy()
-        rows = []
-
-        for _, row in df.iterrows():
-            # Parse date
-            date_iso = self._parse_date(row.get("date", ""))
-            if not date_iso:
-                continue
-
-            # Parse time range
-            time_str = row.get("performance-time", "")
-            start_time, end_time = self._parse_time_range(time_str)
-
-            # Map availability
-            raw_availability = row.get("show-availability", "")
-            availability = self._map_availability(raw_availability)
-
-            # Parse performer/producer/show_name
-            raw_performer = row.get("show-performer", "")
-            raw_title = row.get("show-name", "")
-
-            if smart_parsing:
-                performer, producer, show_name = self._parse_performer_producer_show(
-                    raw_performer, raw_title
-                )
-            else:
-                performer = raw_performer
-                producer = ""
-                show_name = raw_title
-
-            rows.append(
-                {
-                    "performer": performer,
-                    "producer": producer,
-                    "show_name": show_name,
-                    "original_show_name": raw_title,
-                    "venue_name": row.get("show-location", ""),
-                    "date": date_iso,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "availability": availability,
-                }
-            )
-
-        result = pd.DataFrame(rows)
+        # Drop rows whose date did not parse
+        if "date" in df.columns:
+            dates = self._parse_dates(df["date"])
+        else:
+            dates = pd.Series(pd.NaT, index=df.index)
+        keep = dates.notna()
+        df = df[keep]
+        dates = dates[keep]
+
+        missing = pd.Series("", index=df.index, dtype=object)
+        start_times, end_times = self._parse_time_ranges(
+            df.get("performance-time", missing)
+        )
+        raw_performers = df.get("show-performer", missing)
+        raw_titles = df.get("show-name", missing)
+
+        if smart_parsing:
+            # Every performance of a show repeats the same pair; parse each once
+            parsed_pairs: dict[tuple[str, str], tuple[str, str, str]] = {}
+            parsed = []
+            for pair in zip(raw_performers, raw_titles, strict=True):
+                result = parsed_pairs.get(pair)
+                if result is None:
+                    result = self._parse_performer_producer_show(*pair)
+                    parsed_pairs[pair] = result
+                parsed.append(result)
+            performers = [performer for performer, _, _ in parsed]
+            producers = [producer for _, producer, _ in parsed]
+            show_names = [show_name for _, _, show_name in parsed]
+        else:
+            performers = raw_performers.tolist()
+            producers = [""] * len(df)
+            show_names = raw_titles.tolist()
+
+        result = pd.DataFrame(
+            {
+                "performer": performers,
+                "producer": producers,
+                "show_name": show_names,
+                "original_show_name": raw_titles.tolist(),
+                "venue_name": df.get("show-location", missing).tolist(),
+                "date": self._format_dates(dates).tolist(),
+                "start_time": start_times.tolist(),
+                "end_time": end_times.tolist(),
+                "availability": self._map_availabilities(
+                    df.get("show-availability", missing)
+                ).tolist(),
+            }
+        )
         logger.info(f"Converted {len(result)} rows to Festival Planner format")
         return result
 
@@ -278,16 +428,31 @@ class FringeConverter:
         if not time_str or not isinstance(time_str, str):
             return "", ""
 
-        # Handle various separators
-        import re
-
-        parts = re.split(r"\s*[-–]\s*", time_str.strip())
+        parts = _TIME_SEPARATOR_RE.split(time_str.strip())
 
         start_time = parts[0].strip() if parts else ""
         end_time = parts[1].strip() if len(parts) > 1 else ""
 
         return start_time, end_time
 
+    def _parse_time_ranges(self, time_strs: pd.Series) -> tuple[pd.Series, pd.Series]:
+        """Parse a column of time ranges into start and end times.
+
+        Vectorized equivalent of _parse_time_range.
+
+        Args:
+            time_strs: Time range strings
+
+        Returns:
+            Tuple of (start_times, end_times), empty where missing
+        """
+        stripped = time_strs.fillna("").astype(str).str.strip()
+        parts = stripped.str.split(_TIME_SEPARATOR_RE)
+        # Separators absorb surrounding whitespace, so parts need no strip
+        start_times = parts.str[0].fillna("")
+        end_times = parts.str[1].fillna("")
+        return start_times, end_times
+
     def _map_availability(self, raw: str) -> str:
         """Map scraper availability values to Festival Planner format.
 
@@ -298,21 +463,23 @@ class FringeConverter:
             Festival Planner format (e.g., tickets-available)
         """
         if not raw or not isinstance(raw, str):
-            return "tickets-available"
-
-        mapping = {
-            "TICKETS_AVAILABLE": "tickets-available",
-            "TWO_FOR_ONE": "2-for-1-show",
-            "SOLD_OUT": "sold-out",
-            "CANCELLED": "cancelled",
-            "PREVIEW": "preview-show",
-            "FREE_TICKETED": "free-show",
-            "FREE": "free-show",
-            "NO_ALLOCATION": "sold-out",
-            "NO_ALLOCATION_REMAINING": "sold-out",
-        }
-
-        return mapping.get(raw.upper(), "tickets-available")
+            return DEFAULT_AVAILABILITY
+
+        return AVAILABILITY_MAP.get(raw.upper(), DEFAULT_AVAILABILITY)
+
+    def _map_availabilities(self, raw: pd.Series) -> pd.Series:
+        """Map a column of availability values to Festival Planner format.
+
+        Vectorized equivalent of _map_availability.
+
+        Args:
+            raw: Raw availability strings
+
+        Returns:
+            Festival Planner availability strings
+        """
+        mapped = raw.fillna("").astype(str).str.upper().map(AVAILABILITY_MAP)
+        return mapped.fillna(DEFAULT_AVAILABILITY)
 
     def _is_production_company(self, name: str) -> bool:
         """Detect if a name is likely a production company rather than a performer.
@@ -328,58 +495,9 @@ class FringeConverter:
 
         name_lower = name.lower().strip()
 
-        # Common production company patterns
-        company_patterns = [
-            " presents",
-            " present",
-            " productions",
-            " comedy",
-            " management",
-            " entertainment",
-            " ltd",
-            " limited",
-            " inc",
-            " llc",
-            " touring",
-            " theatre",
-            " theater",
-            " arts",
-            " promotions",
-            " agency",
-            " creative",
-            " media",
-            " group",
-            " collective",
-            " ensemble",
-            " worldwide",
-            " talent",
-            " live",
-            " agents",
-            " nation",
-            "free festival",
-            "free fringe",
-            "laughing horse",
-            "pleasance",
-            "gilded balloon",
-            "underbelly",
-            "assembly",
-            "summerhall",
-            "zoo",
-            "just the tonic",
-            "mick perrin",
-            "united agents",
-            "live nation",
-            "seabright",
-            "avalon",
-            "off the kerb",
-            "phil mcintyre",
-            "berk's nest",
-        ]
-
         # Check for common patterns
-        for pattern in company_patterns:
-            if pattern in name_lower:
-                return True
+        if _COMPANY_PATTERN_RE.search(name_lower):
+            return True
 
         # Check for "X & Y" pattern with company keywords
         if " & " in name_lower or " and " in name_lower:
@@ -447,30 +565,8 @@ class FringeConverter:
         text_stripped = text.strip()
 
         # Reject common subtitle patterns
-        subtitle_patterns = [
-            "part ",
-            "act ",
-            "episode",
-            "chapter",
-            "volume",
-            "vol ",
-            "season",
-            "series",
-            "the ",
-            "a ",
-            "an ",
-            "live",
-            "work in progress",
-            "wip",
-            "preview",
-            "encore",
-            "returns",
-            "reloaded",
-        ]
-
-        for pattern in subtitle_patterns:
-            if text_lower.startswith(pattern) or text_lower == pattern.strip():
-                return False
+        if _SUBTITLE_PREFIX_RE.match(text_lower) or text_lower in _SUBTITLE_WORDS:
+            return False
 
         # Reject all-caps abbreviations (likely show acronyms like "CSI", "NYC")
         if text_stripped.isupper() and len(text_stripped) <= 5:
@@ -568,6 +664,7 @@ def save_all_formats(
     base_filename: str,
     formats: list[str] | None = None,
     default_year: int = 2025,
+    csv_engine: str = "pandas",
 ) -> dict[str, Path]:
     """Save data in multiple formats.
 
@@ -578,6 +675,7 @@ def save_all_formats(
         formats: List of formats to save ("cleaned", "summary", "wide")
                  or None for all formats
         default_year: Year for date parsing
+        csv_engine: CSV writer to use ("pandas" or "pyarrow")
 
     Returns:
         Dictionary mapping format name to output path
@@ -585,7 +683,7 @@ def save_all_formats(
     if formats is None:
         formats = ["cleaned", "summary", "wide"]
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_dir)
 
     converter = FringeConverter(default_year=default_year)
     results: dict[str, Path] = {}
@@ -597,22 +695,86 @@ def save_all_formats(
 
     if "cleaned" in formats and df_cleaned is not None:
         path = output_dir / f"Cleaned-{base_filename}.csv"
-        df_cleaned.to_csv(path, index=False)
+        write_frame(df_cleaned, path, fmt="csv", csv_engine=csv_engine)
         results["cleaned"] = path
         logger.info(f"Saved cleaned data to {path}")
 
     if "summary" in formats and df_cleaned is not None:
         df_summary = converter.create_summary(df_cleaned)
         path = output_dir / f"Summary-{base_filename}.csv"
-        df_summary.to_csv(path, index=False)
+        write_frame(df_summary, path, fmt="csv", csv_engine=csv_engine)
         results["summary"] = path
         logger.info(f"Saved summary to {path}")
 
     if "wide" in formats and df_cleaned is not None:
         df_wide = converter.create_wide_format(df_cleaned)
         path = output_dir / f"WideFormat-{base_filename}.csv"
-        df_wide.to_csv(path, index=False)
+        write_frame(df_wide, path, fmt="csv", csv_engine=csv_engine)
         results["wide"] = path
         logger.info(f"Saved wide format to {path}")
 
     return results
+
+
+def convert_file(
+    input_file: Path,
+    output_dir: Path,
+    formats: list[str] | None = None,
+    default_year: int = 2025,
+    csv_engine: str = "pandas",
+) -> tuple[int, dict[str, Path]]:
+    """Load one raw data file and save it in multiple formats.
+
+    Module-level so it can be run in a worker process.
+
+    Args:
+        input_file: Raw CSV, Parquet or Feather file
+        output_dir: Output directory
+        formats: List of formats to save, or None for all formats
+        default_year: Year for date parsing
+        csv_engine: CSV writer to use ("pandas" or "pyarrow")
+
+    Returns:
+        Tuple of (rows loaded, dictionary mapping format name to output path)
+    """
+    converter = FringeConverter(default_year=default_year)
+    df = converter.load_raw_csv(input_file)
+    results = save_all_formats(
+        df,
+        output_dir,
+        input_file.stem,
+        formats=formats,
+        default_year=default_year,
+        csv_engine=csv_engine,
+    )
+    return len(df), results
+
+
+def export_file(
+    input_file: Path,
+    output: Path,
+    default_year: int = 2025,
+    smart_parsing: bool = True,
+    output_format: str | None = None,
+    csv_engine: str = "pandas",
+) -> tuple[int, int]:
+    """Load one raw data file and write it in Festival Planner format.
+
+    Module-level so it can be run in a worker process.
+
+    Args:
+        input_file: Raw CSV, Parquet or Feather file
+        output: Output file path
+        default_year: Year for date parsing
+        smart_parsing: Whether to split performer/producer/show names
+        output_format: Output format (inferred from the extension if None)
+        csv_engine: CSV writer to use ("pandas" or "pyarrow")
+
+    Returns:
+        Tuple of (rows loaded, performances exported)
+    """
+    converter = FringeConverter(default_year=default_year)
+    df = converter.load_raw_csv(input_file)
+    df_export = converter.to_festival_planner_format(df, smart_parsing=smart_parsing)
+    write_frame(df_export, output, fmt=output_format, csv_engine=csv_engine)
+    return len(df), len(df_export)
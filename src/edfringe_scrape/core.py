@@ -1,16 +1,22 @@
 """Core business logic for Edinburgh Fringe scraping."""
 
 import logging
-from collections.abc import Iterator
-from datetime import datetime
+import queue
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, time
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlencode
 
 import pandas as pd
 
 from .config import Settings
 from .models import Genre, PerformanceDetail, ScrapedShow, ShowCard, ShowInfo, VenueInfo
-from .parser import FringeParser
+from .parser import FringeParser, NextDataParser
 from .scraper import APIDiscovery, ScrapingDogClient, ScrapingDogError
+from .storage import ensure_dir, fresh_sidecar, write_csv_with_sidecar, write_frame
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +31,56 @@ def ensure_output_dir(settings: Settings) -> Path:
         Path to output directory
     """
     output_path = Path(settings.output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_path)
     return output_path
 
 
+def search_url(
+    base_url: str,
+    genre: Genre,
+    recently_added: str | None = None,
+    page: int = 1,
+) -> str:
+    """Build the What's On search URL for a genre.
+
+    Args:
+        base_url: Fringe website base URL
+        genre: Genre to search
+        recently_added: Optional recently-added filter (e.g. "LAST_SEVEN_DAYS")
+        page: Page number (1-indexed; omitted from the URL for page 1)
+
+    Returns:
+        Search page URL with URL-encoded query parameters
+    """
+    params: dict[str, str | int] = {"search": "true", "genres": genre.url_param}
+    if recently_added:
+        params["recentlyAdded"] = recently_added
+    if page > 1:
+        params["page"] = page
+    return f"{base_url}/tickets/whats-on?{urlencode(params)}"
+
+
+def _unseen_cards(cards: Iterable[ShowCard], seen_urls: set[str]) -> list[ShowCard]:
+    """Filter out cards whose URL has been seen, recording the new ones.
+
+    Checks and records each URL in a single pass, so a show listed twice
+    on the same page is only returned once.
+
+    Args:
+        cards: Cards from one search results page
+        seen_urls: URLs already returned; updated in place
+
+    Returns:
+        Cards not seen before, in page order
+    """
+    new_cards = []
+    for card in cards:
+        if card.url not in seen_urls:
+            seen_urls.add(card.url)
+            new_cards.append(card)
+    return new_cards
+
+
 class FringeScraper:
     """Orchestrates scraping of Edinburgh Fringe show listings."""
 
@@ -43,6 +95,16 @@ class FringeScraper:
         self.parser = FringeParser(default_year=settings.default_year)
         self._build_id: str | None = None
 
+    def close(self) -> None:
+        """Close the underlying HTTP client's pooled connections."""
+        self.client.close()
+
+    def __enter__(self) -> "FringeScraper":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def scrape_genre(
         self,
         genre: Genre,
@@ -77,7 +139,7 @@ class FringeScraper:
                 logger.info(f"No more results on page {page}")
                 break
 
-            new_cards = [c for c in cards if c.url not in seen_urls]
+            new_cards = _unseen_cards(cards, seen_urls)
             if not new_cards:
                 logger.info("No new shows found, stopping")
                 break
@@ -86,7 +148,6 @@ class FringeScraper:
                 if max_shows and show_count >= max_shows:
                     break
 
-                seen_urls.add(card.url)
                 show_count += 1
 
                 if skip_details:
@@ -120,16 +181,7 @@ class FringeScraper:
         Returns:
             List of ShowCard objects
         """
-        url = (
-            f"{self.settings.base_url}/tickets/whats-on"
-            f"?search=true&genres={genre.url_param}"
-        )
-
-        if recently_added:
-            url += f"&recentlyAdded={recently_added}"
-
-        if page > 1:
-            url += f"&page={page}"
+        url = search_url(self.settings.base_url, genre, recently_added, page)
 
         logger.info(f"Fetching search page {page} for {genre.value}")
 
@@ -188,53 +240,108 @@ class FringeScraper:
             venue_info=venue_info,
         )
 
+    def _fetch_venue_contact(self, venue: VenueInfo) -> VenueInfo:
+        """Fetch contact details for one venue from its venue page.
+
+        Args:
+            venue: Venue to look up
+
+        Returns:
+            VenueInfo with contact info filled in, or the venue unchanged if
+            it has no page or the page could not be fetched
+        """
+        if not venue.venue_page_url:
+            return venue
+
+        try:
+            response = self.client.fetch_page(
+                venue.venue_page_url, dynamic=True
+            )
+            venue_page_data = NextDataParser.extract_venue_page_data(
+                response.html
+            )
+            if venue_page_data:
+                phone, email = NextDataParser.parse_venue_contact(
+                    venue_page_data
+                )
+                logger.debug(
+                    f"Fetched contacts for {venue.venue_name}: "
+                    f"phone={phone}, email={email}"
+                )
+                return venue.model_copy(
+                    update={
+                        "contact_phone": phone,
+                        "contact_email": email,
+                    }
+                )
+        except ScrapingDogError as e:
+            logger.warning(
+                f"Failed to fetch venue page for {venue.venue_name}: {e}"
+            )
+
+        return venue
+
+    def iter_venue_contacts(
+        self,
+        venues: list[VenueInfo],
+        max_workers: int = 1,
+    ) -> Iterator[VenueInfo]:
+        """Fetch contact details for many venues concurrently.
+
+        Each distinct venue page is fetched once; venues sharing a page URL
+        all receive the contacts from that single fetch. Venues without a
+        page URL are yielded unchanged.
+
+        Args:
+            venues: Venues to look up
+            max_workers: Maximum number of concurrent fetches
+
+        Yields:
+            VenueInfo objects in completion order
+        """
+        venues_by_url: dict[str, list[VenueInfo]] = defaultdict(list)
+        for venue in venues:
+            venues_by_url[venue.venue_page_url].append(venue)
+
+        yield from venues_by_url.pop("", [])
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_venue_contact, group[0]): group
+                for group in venues_by_url.values()
+            }
+            for future in as_completed(futures):
+                fetched = future.result()
+                yield fetched
+                for venue in futures[future][1:]:
+                    yield venue.model_copy(
+                        update={
+                            "contact_phone": fetched.contact_phone,
+                            "contact_email": fetched.contact_email,
+                        }
+                    )
+
     def fetch_venue_contacts(
         self,
         venues: dict[str, VenueInfo],
         known_codes: set[str],
+        max_workers: int = 1,
     ) -> dict[str, VenueInfo]:
         """Fetch contact details for new venues from venue pages.
 
         Args:
             venues: Dict of all venues from current scrape
             known_codes: Set of venue codes already in cache
+            max_workers: Maximum number of concurrent fetches
 
         Returns:
             Updated venues dict with contact info filled in
         """
-        from .parser import NextDataParser
-
-        for code, venue in venues.items():
-            if code in known_codes:
-                continue
-            if not venue.venue_page_url:
-                continue
-
-            try:
-                response = self.client.fetch_page(
-                    venue.venue_page_url, dynamic=True
-                )
-                venue_page_data = NextDataParser.extract_venue_page_data(
-                    response.html
-                )
-                if venue_page_data:
-                    phone, email = NextDataParser.parse_venue_contact(
-                        venue_page_data
-                    )
-                    venues[code] = venue.model_copy(
-                        update={
-                            "contact_phone": phone,
-                            "contact_email": email,
-                        }
-                    )
-                    logger.debug(
-                        f"Fetched contacts for {venue.venue_name}: "
-                        f"phone={phone}, email={email}"
-                    )
-            except ScrapingDogError as e:
-                logger.warning(
-                    f"Failed to fetch venue page for {venue.venue_name}: {e}"
-                )
+        new_venues = [
+            venue for code, venue in venues.items() if code not in known_codes
+        ]
+        for venue in self.iter_venue_contacts(new_venues, max_workers):
+            venues[venue.venue_code] = venue
 
         return venues
 
@@ -267,7 +374,7 @@ class FringeScraper:
             if not cards:
                 break
 
-            new_cards = [c for c in cards if c.url not in seen_urls]
+            new_cards = _unseen_cards(cards, seen_urls)
             if not new_cards:
                 break
 
@@ -275,7 +382,6 @@ class FringeScraper:
                 if max_shows and show_count >= max_shows:
                     break
 
-                seen_urls.add(card.url)
                 show_count += 1
                 yield card
 
@@ -321,70 +427,152 @@ class FringeScraper:
         """
         return self._fetch_show_details(card, genre)
 
+    def fetch_shows_with_details(
+        self,
+        cards: Iterable[ShowCard],
+        genre: Genre,
+        max_workers: int = 1,
+    ) -> Iterator[tuple[int, ScrapedShow]]:
+        """Fetch details for many shows concurrently.
+
+        Detail fetches are network-bound, so they run on a thread pool.
+        The client's rate limiter still spaces out request start times.
+        Cards may be a lazy iterator such as fetch_all_search_results():
+        each card is submitted as soon as it is produced, so detail fetches
+        overlap with fetching the remaining search pages, and fetches that
+        finish meanwhile are yielded between cards rather than only once
+        listing is done. If the card iterator raises, fetches that have
+        not started are cancelled.
+
+        Args:
+            cards: ShowCards from search results
+            genre: Genre of the shows
+            max_workers: Maximum number of concurrent fetches
+
+        Yields:
+            (index into cards, ScrapedShow) tuples in completion order
+        """
+        finished: queue.SimpleQueue[Future[ScrapedShow]] = queue.SimpleQueue()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Fetches submitted but not yet yielded
+            futures: dict[Future[ScrapedShow], int] = {}
+            try:
+                for idx, card in enumerate(cards):
+                    future = executor.submit(self._fetch_show_details, card, genre)
+                    futures[future] = idx
+                    future.add_done_callback(finished.put)
+                    while not finished.empty():
+                        done = finished.get()
+                        yield futures.pop(done), done.result()
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
 
 def shows_to_dataframe(
-    shows: list[ScrapedShow],
+    shows: Iterable[ScrapedShow],
     source_url: str | None = None,
     scrape_time: datetime | None = None,
+    genre: str | None = None,
 ) -> pd.DataFrame:
     """Convert scraped shows to DataFrame matching existing CSV format.
 
+    Shows are consumed one at a time, so a generator such as
+    FringeScraper.scrape_genre() can be passed without building a list.
+
     Args:
-        shows: List of ScrapedShow objects
+        shows: ScrapedShow objects
         source_url: Source URL to include in output
         scrape_time: Timestamp when scrape started (ISO format)
+        genre: If given, added as a trailing "genre" column on every row
 
     Returns:
         DataFrame with columns matching Web Scraper.io output
     """
-    rows = []
+    return pd.DataFrame(
+        performance_columns(shows, source_url, scrape_time, genre)
+    )
 
-    scrape_time_str = scrape_time.isoformat() if scrape_time else ""
+
+def performance_columns(
+    shows: Iterable[ScrapedShow],
+    source_url: str | None = None,
+    scrape_time: datetime | None = None,
+    genre: str | None = None,
+    into: dict[str, list[str]] | None = None,
+) -> dict[str, list[str]]:
+    """Collect performance rows as one list per column.
+
+    Each show contributes one row per performance, or one row with empty
+    performance fields if it has none. Building column lists directly is
+    cheaper than one dict per row, and several calls (e.g. one per genre)
+    can append to the same columns before a single DataFrame build.
+
+    Args:
+        shows: ScrapedShow objects
+        source_url: Source URL to include in output
+        scrape_time: Timestamp when scrape started (ISO format)
+        genre: If given, added as a trailing "genre" column on every row
+        into: Columns from an earlier call to append to; pass genre on
+            every call or on none
+
+    Returns:
+        Dict mapping column name to values, in shows_to_dataframe order
+    """
+    columns = into if into is not None else {}
+    # "genre" is the last of PERFORMANCE_COLUMNS
+    names = PERFORMANCE_COLUMNS if genre is not None else PERFORMANCE_COLUMNS[:-1]
+    for name in names:
+        columns.setdefault(name, [])
+
+    hrefs = columns["show-link-href"]
+    titles: list[str] = []
+    performers: list[str] = []
+    dates = columns["date"]
+    times = columns["performance-time"]
+    availabilities = columns["show-availability"]
+    locations = columns["show-location"]
+    first_row = len(hrefs)
 
     for show in shows:
         if show.performances:
             for perf in show.performances:
-                time_str = ""
-                if perf.start_time:
-                    time_str = perf.start_time.strftime("%H:%M")
-                    if perf.end_time:
-                        time_str += f" - {perf.end_time.strftime('%H:%M')}"
-
-                date_str = _format_date_for_csv(perf.date)
-
-                rows.append(
-                    {
-                        "web-scraper-scrape-time": scrape_time_str,
-                        "show-link-href": show.url,
-                        "show-link": show.title,
-                        "show-name": show.title,
-                        "show-performer": show.performer or "",
-                        "date": date_str,
-                        "performance-time": time_str,
-                        "show-availability": perf.availability or "",
-                        "show-location": perf.venue or "",
-                        "web-scraper-start-url": source_url or "",
-                    }
-                )
+                dates.append(_format_date_for_csv(perf.date))
+                times.append(_format_time_range(perf.start_time, perf.end_time))
+                availabilities.append(perf.availability or "")
+                locations.append(perf.venue or "")
+            row_count = len(show.performances)
         else:
-            rows.append(
-                {
-                    "web-scraper-scrape-time": scrape_time_str,
-                    "show-link-href": show.url,
-                    "show-link": show.title,
-                    "show-name": show.title,
-                    "show-performer": show.performer or "",
-                    "date": "",
-                    "performance-time": "",
-                    "show-availability": "",
-                    "show-location": "",
-                    "web-scraper-start-url": source_url or "",
-                }
-            )
+            dates.append("")
+            times.append("")
+            availabilities.append("")
+            locations.append("")
+            row_count = 1
 
-    return pd.DataFrame(rows)
+        hrefs.extend([show.url] * row_count)
+        titles.extend([show.title] * row_count)
+        performers.extend([show.performer or ""] * row_count)
+
+    columns["show-link"].extend(titles)
+    columns["show-name"].extend(titles)
+    columns["show-performer"].extend(performers)
+
+    added = len(hrefs) - first_row
+    scrape_time_str = scrape_time.isoformat() if scrape_time else ""
+    columns["web-scraper-scrape-time"].extend([scrape_time_str] * added)
+    columns["web-scraper-start-url"].extend([source_url or ""] * added)
+    if genre is not None:
+        columns["genre"].extend([genre] * added)
 
+    return columns
 
+
+# Performances share a few dozen dates and start/end times, so each distinct
+# value is formatted once rather than once per row
+@lru_cache(maxsize=1024)
 def _format_date_for_csv(date: datetime.date) -> str:
     """Format date for CSV output (e.g., 'Wednesday 30 July').
 
@@ -397,17 +585,37 @@ def _format_date_for_csv(date: datetime.date) -> str:
     return date.strftime("%A %d %B")
 
 
+@lru_cache(maxsize=1024)
+def _format_time_range(start: time | None, end: time | None) -> str:
+    """Format performance times for CSV output (e.g., '19:30 - 20:30').
+
+    Args:
+        start: Start time
+        end: End time (ignored without a start time)
+
+    Returns:
+        Formatted time range, just the start time, or "" if there is none
+    """
+    if not start:
+        return ""
+    if not end:
+        return start.strftime("%H:%M")
+    return f"{start.strftime('%H:%M')} - {end.strftime('%H:%M')}"
+
+
 def save_raw_csv(
     df: pd.DataFrame,
     output_dir: Path,
     genre: str,
+    csv_engine: str = "pandas",
 ) -> Path:
-    """Save raw scraped data to CSV.
+    """Save raw scraped data to CSV (with a Parquet sidecar).
 
     Args:
         df: DataFrame to save
         output_dir: Output directory
         genre: Genre name for filename
+        csv_engine: CSV writer ("pandas" or "pyarrow")
 
     Returns:
         Path to saved file
@@ -416,17 +624,17 @@ def save_raw_csv(
     filename = f"{timestamp}-EdFringe-{genre}.csv"
     output_path = output_dir / filename
 
-    df.to_csv(output_path, index=False)
+    write_csv_with_sidecar(df, output_path, csv_engine=csv_engine)
     logger.info(f"Saved {len(df)} rows to {output_path}")
 
     return output_path
 
 
-def show_info_to_dataframe(shows: list[ScrapedShow]) -> pd.DataFrame:
+def show_info_to_dataframe(shows: Iterable[ScrapedShow]) -> pd.DataFrame:
     """Convert scraped shows to a show-info DataFrame (one row per show).
 
     Args:
-        shows: List of ScrapedShow objects
+        shows: ScrapedShow objects
 
     Returns:
         DataFrame with show info columns
@@ -478,7 +686,7 @@ def save_show_info_csv(
     filename = f"{timestamp}-EdFringe-{genre}-show-info.csv"
     output_path = output_dir / filename
 
-    df.to_csv(output_path, index=False)
+    write_frame(df, output_path, fmt="csv")
     logger.info(f"Saved {len(df)} show info rows to {output_path}")
 
     return output_path
@@ -490,8 +698,9 @@ def save_snapshot_csv(
     date_str: str,
     mode: str,
     suffix: str = "snapshot",
+    csv_engine: str = "pandas",
 ) -> Path:
-    """Save a DataFrame as a timestamped snapshot CSV.
+    """Save a DataFrame as a timestamped snapshot CSV (with a Parquet sidecar).
 
     Args:
         df: DataFrame to save
@@ -499,14 +708,15 @@ def save_snapshot_csv(
         date_str: Date string (e.g. "2026-02-15")
         mode: Scrape mode label ("full" or "recent")
         suffix: File suffix (e.g. "snapshot" or "show-info")
+        csv_engine: CSV writer ("pandas" or "pyarrow")
 
     Returns:
         Path to saved file
     """
-    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(snapshot_dir)
     filename = f"{date_str}-{mode}-{suffix}.csv"
     path = snapshot_dir / filename
-    df.to_csv(path, index=False)
+    write_csv_with_sidecar(df, path, csv_engine=csv_engine)
     logger.info(f"Saved {len(df)} rows to {path}")
     return path
 
@@ -583,7 +793,7 @@ def save_venue_cache(
                 "description", "contact_phone", "contact_email",
             ]
         )
-    df.to_csv(cache_path, index=False)
+    write_frame(df, cache_path, fmt="csv")
     logger.info(f"Saved {len(df)} venues to {cache_path}")
     return cache_path
 
@@ -603,6 +813,15 @@ PERFORMANCE_COLUMNS = [
     "genre",
 ]
 
+# Performance columns with few distinct values, held as categoricals in memory
+PERFORMANCE_CATEGORY_COLUMNS = [
+    "web-scraper-scrape-time",
+    "show-availability",
+    "show-location",
+    "web-scraper-start-url",
+    "genre",
+]
+
 SHOW_INFO_COLUMNS = [
     "show-link-href",
     "show-name",
@@ -623,18 +842,43 @@ SHOW_INFO_COLUMNS = [
 ]
 
 
-def load_canonical(path: Path, expected_columns: list[str]) -> pd.DataFrame:
+# Rows per chunk when filtering a canonical file while reading it
+_CANONICAL_CHUNK_ROWS = 200_000
+
+
+def load_canonical(
+    path: Path,
+    expected_columns: list[str],
+    exclude_genres: set[str] | None = None,
+) -> pd.DataFrame:
     """Load a canonical CSV file, or return an empty DataFrame with expected schema.
 
+    If the CSV has an up-to-date Parquet sidecar (written by save_canonical),
+    the sidecar is read instead.
+
     Args:
         path: Path to CSV file
         expected_columns: Column names for the empty DataFrame fallback
+        exclude_genres: Drop rows with these genres while reading, in chunks,
+            so rows that are about to be replaced are never held in full
 
     Returns:
         DataFrame with data or empty DataFrame with correct columns
     """
     if path.exists():
-        df = pd.read_csv(path)
+        sidecar = fresh_sidecar(path)
+        if sidecar is not None:
+            df = _read_canonical_sidecar(sidecar, exclude_genres)
+        elif exclude_genres:
+            chunks = [
+                chunk[~chunk["genre"].isin(exclude_genres)]
+                if "genre" in chunk.columns
+                else chunk
+                for chunk in pd.read_csv(path, chunksize=_CANONICAL_CHUNK_ROWS)
+            ]
+            df = pd.concat(chunks, ignore_index=True)
+        else:
+            df = pd.read_csv(path)
         # Ensure all expected columns exist (fill missing with empty string)
         for col in expected_columns:
             if col not in df.columns:
@@ -643,9 +887,32 @@ def load_canonical(path: Path, expected_columns: list[str]) -> pd.DataFrame:
     return pd.DataFrame(columns=expected_columns)
 
 
+def _read_canonical_sidecar(
+    sidecar: Path, exclude_genres: set[str] | None
+) -> pd.DataFrame:
+    """Read a canonical Parquet sidecar, filtering genres at scan time.
+
+    Args:
+        sidecar: Parquet sidecar path
+        exclude_genres: Genres whose rows should not be loaded
+
+    Returns:
+        DataFrame with the remaining rows
+    """
+    import pyarrow.parquet as pq
+
+    filters = None
+    if exclude_genres and "genre" in pq.read_schema(sidecar).names:
+        filters = [("genre", "not in", sorted(exclude_genres))]
+    return pd.read_parquet(sidecar, engine="pyarrow", filters=filters)
+
+
 def save_canonical(df: pd.DataFrame, path: Path) -> Path:
     """Save a DataFrame to a canonical CSV file, creating parent dirs.
 
+    A Parquet sidecar is written alongside for faster reloads; the CSV
+    stays the file downstream tools read.
+
     Args:
         df: DataFrame to save
         path: Output file path
@@ -653,8 +920,8 @@ def save_canonical(df: pd.DataFrame, path: Path) -> Path:
     Returns:
         Path to saved file
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(path, index=False)
+    ensure_dir(path.parent)
+    write_csv_with_sidecar(df, path)
     logger.info(f"Saved {len(df)} rows to {path}")
     return path
 
@@ -28,6 +28,11 @@ class Genre(StrEnum):
         return self.value
 
 
+# Computed once so CLI validation is a set/dict lookup rather than an enum walk
+GENRE_VALUES: tuple[str, ...] = tuple(g.value for g in Genre)
+GENRES_BY_VALUE: dict[str, Genre] = {g.value: g for g in Genre}
+
+
 class Show(BaseModel):
     """A show listed on the Edinburgh Fringe."""
 
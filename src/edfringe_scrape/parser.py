@@ -1,6 +1,7 @@
 """HTML parsing utilities for Edinburgh Fringe pages."""
 
 import datetime
+import importlib.util
 import json
 import logging
 import re
@@ -10,6 +11,33 @@ from bs4 import BeautifulSoup, Tag
 
 from .models import PerformanceDetail, ShowCard, ShowInfo, VenueInfo
 
+# BeautifulSoup tree builder: lxml's C parser is several times faster than
+# the pure-Python html.parser on rendered pages, so use it when installed
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Patterns used on every fetched page or parsed value, compiled once
+_NEXT_DATA_RE = re.compile(
+    r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+)
+_DAY_MONTH_RE = re.compile(r"(\d{1,2})\s+(\w+)")
+_TIME_SEPARATOR_RE = re.compile(r"\s*[-–]\s*")
+_HOUR_MINUTE_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
+_MONTH_NAMES = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+
 
 class ShowDetailResult(NamedTuple):
     """Result from parsing a show detail page."""
@@ -38,8 +66,7 @@ class NextDataParser:
         Returns:
             Parsed JSON data or None if not found
         """
-        pattern = r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>'
-        match = re.search(pattern, html, re.DOTALL)
+        match = _NEXT_DATA_RE.search(html)
 
         if not match:
             logger.debug("No __NEXT_DATA__ found in page")
@@ -417,7 +444,7 @@ class FringeParser:
         Returns:
             List of ShowCard objects
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
         cards: list[ShowCard] = []
 
         card_elements = soup.select('div[class*="event-listing_eventListingItem"]')
@@ -529,7 +556,7 @@ class FringeParser:
         Returns:
             List of PerformanceDetail objects
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
         performances: list[PerformanceDetail] = []
 
         date_buttons = soup.select('div[class*="date-picker_container"] button')
@@ -583,22 +610,8 @@ class FringeParser:
         Returns:
             True if text matches date pattern
         """
-        months = [
-            "january",
-            "february",
-            "march",
-            "april",
-            "may",
-            "june",
-            "july",
-            "august",
-            "september",
-            "october",
-            "november",
-            "december",
-        ]
         text_lower = text.lower()
-        return any(month in text_lower for month in months)
+        return any(month in text_lower for month in _MONTH_NAMES)
 
     def parse_date(self, date_str: str) -> datetime.date | None:
         """Parse date string like 'Wednesday 30 July' to date object.
@@ -614,7 +627,7 @@ class FringeParser:
 
         date_str = date_str.strip()
 
-        match = re.search(r"(\d{1,2})\s+(\w+)", date_str)
+        match = _DAY_MONTH_RE.search(date_str)
         if not match:
             logger.debug(f"Could not parse date: {date_str}")
             return None
@@ -646,7 +659,7 @@ class FringeParser:
 
         time_str = time_str.strip()
 
-        parts = re.split(r"\s*[-–]\s*", time_str)
+        parts = _TIME_SEPARATOR_RE.split(time_str)
 
         start_time = self._parse_single_time(parts[0]) if parts else None
         end_time = self._parse_single_time(parts[1]) if len(parts) > 1 else None
@@ -667,7 +680,7 @@ class FringeParser:
 
         time_str = time_str.strip()
 
-        match = re.match(r"(\d{1,2}):(\d{2})", time_str)
+        match = _HOUR_MINUTE_RE.match(time_str)
         if match:
             hour, minute = int(match.group(1)), int(match.group(2))
             try:
@@ -686,6 +699,6 @@ class FringeParser:
         Returns:
             Show name or None
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
         h1 = soup.select_one("h1")
         return h1.get_text(strip=True) if h1 else None
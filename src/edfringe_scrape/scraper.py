@@ -2,12 +2,16 @@
 
 import json
 import logging
+import random
 import re
+import threading
 import time
+from pathlib import Path
 
 import httpx
 import tenacity
 
+from .cache import ResponseCache
 from .config import Settings
 from .models import ScrapingDogResponse
 
@@ -21,6 +25,9 @@ SCRAPINGDOG_BASE_URL = "https://api.scrapingdog.com/scrape"
 # Max characters of response text to include in error messages
 _ERROR_TEXT_LIMIT = 200
 
+# Pool size for the shared HTTP client; matches the scrape_concurrency cap
+_MAX_CONNECTIONS = 32
+
 
 class ScrapingDogError(Exception):
     """Error from Scraping Dog API."""
@@ -48,6 +55,10 @@ class ScrapingDogClient:
     """HTTP client for Scraping Dog API.
 
     Handles rate limiting, JavaScript rendering, and API responses.
+    A single pooled HTTP client is reused for every request so connections
+    to the API are kept alive; call close() (or use as a context manager)
+    when done. If settings.response_cache_ttl_hours is set, successful
+    responses are cached on disk and reused while fresh.
     """
 
     def __init__(self, settings: Settings):
@@ -58,10 +69,38 @@ class ScrapingDogClient:
         """
         self.settings = settings
         self._last_request_time: float | None = None
+        self._rate_limit_lock = threading.Lock()
 
         if not settings.scrapingdog_api_key:
             raise ScrapingDogError("SCRAPINGDOG_API_KEY not configured")
 
+        self._http = httpx.Client(
+            timeout=60.0,
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_CONNECTIONS,
+            ),
+        )
+
+        self._cache: ResponseCache | None = None
+        if settings.response_cache_ttl_hours > 0:
+            self._cache = ResponseCache(
+                Path(settings.cache_dir) / "responses.sqlite",
+                ttl_seconds=settings.response_cache_ttl_hours * 3600,
+            )
+
+    def close(self) -> None:
+        """Close pooled HTTP connections and the response cache."""
+        self._http.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def __enter__(self) -> "ScrapingDogClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def fetch_page(
         self,
         url: str,
@@ -84,6 +123,12 @@ class ScrapingDogClient:
         Raises:
             ScrapingDogError: If API request fails after all retries
         """
+        cache_key = ResponseCache.make_key(url, dynamic)
+        if self._cache is not None:
+            html = self._cache.get(cache_key)
+            if html is not None:
+                return ScrapingDogResponse(html=html, credits_used=0)
+
         self._rate_limit()
 
         if wait_ms is None:
@@ -110,7 +155,7 @@ class ScrapingDogClient:
         )
 
         try:
-            return retryer(self._do_fetch, params=params, dynamic=dynamic)
+            response = retryer(self._do_fetch, params=params, dynamic=dynamic)
         except ScrapingDogError:
             logger.warning(
                 "Request failed after %d attempts, data may be lost: %s",
@@ -119,6 +164,10 @@ class ScrapingDogClient:
             )
             raise
 
+        if self._cache is not None:
+            self._cache.set(cache_key, response.html)
+        return response
+
     def _do_fetch(
         self,
         params: dict[str, str],
@@ -137,8 +186,7 @@ class ScrapingDogClient:
             ScrapingDogError: If API request fails
         """
         try:
-            with httpx.Client(timeout=60.0) as client:
-                response = client.get(SCRAPINGDOG_BASE_URL, params=params)
+            response = self._http.get(SCRAPINGDOG_BASE_URL, params=params)
 
             status = response.status_code
             text = response.text
@@ -174,16 +222,26 @@ class ScrapingDogClient:
             raise ScrapingDogError(f"Request failed: {e}") from e
 
     def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        if self._last_request_time is not None:
-            elapsed = time.time() - self._last_request_time
-            delay_sec = self.settings.request_delay_ms / 1000.0
-            if elapsed < delay_sec:
-                sleep_time = delay_sec - elapsed
-                logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-
-        self._last_request_time = time.time()
+        """Enforce rate limiting between requests.
+
+        Safe to call from multiple threads: request start times stay at
+        least ``request_delay_ms`` apart even when fetches run concurrently.
+        A random extra delay of up to ``request_jitter_ms`` is added to each
+        gap.
+        """
+        with self._rate_limit_lock:
+            if self._last_request_time is not None:
+                elapsed = time.time() - self._last_request_time
+                delay_ms = self.settings.request_delay_ms
+                if self.settings.request_jitter_ms:
+                    delay_ms += random.uniform(0, self.settings.request_jitter_ms)
+                delay_sec = delay_ms / 1000.0
+                if elapsed < delay_sec:
+                    sleep_time = delay_sec - elapsed
+                    logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
+                    time.sleep(sleep_time)
+
+            self._last_request_time = time.time()
 
 
 class APIDiscovery:
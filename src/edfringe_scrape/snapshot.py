@@ -1,14 +1,26 @@
 """Snapshot comparison for tracking Edinburgh Fringe performance changes."""
 
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 
+from .storage import (
+    digest_path,
+    format_for_path,
+    frame_digest,
+    fresh_sidecar,
+    read_frame,
+)
+
 logger = logging.getLogger(__name__)
 
+# Columns that change on every run and so are left out of snapshot digests
+DIGEST_EXCLUDED_COLUMNS = ("web-scraper-scrape-time",)
+
 
 @dataclass
 class PerformanceChange:
@@ -244,6 +256,9 @@ def _extract_snapshot_date(df: pd.DataFrame) -> str:
 def find_latest_snapshot(snapshot_dir: Path, exclude_date: str | None = None) -> Path | None:
     """Find the most recent snapshot file.
 
+    Snapshots are CSV files, optionally with a Parquet sidecar. A Parquet
+    snapshot with no CSV of the same name is also picked up.
+
     Args:
         snapshot_dir: Directory containing snapshots
         exclude_date: Date string to exclude (e.g., today's date)
@@ -254,27 +269,96 @@ def find_latest_snapshot(snapshot_dir: Path, exclude_date: str | None = None) ->
     if not snapshot_dir.exists():
         return None
 
-    snapshots = sorted(snapshot_dir.glob("*-snapshot.csv"), reverse=True)
+    snapshots = {p.stem: p for p in snapshot_dir.glob("*-snapshot.parquet")}
+    # A CSV wins over its own sidecar
+    snapshots.update({p.stem: p for p in snapshot_dir.glob("*-snapshot.csv")})
 
-    for snapshot in snapshots:
-        if exclude_date and exclude_date in snapshot.name:
+    for stem in sorted(snapshots, reverse=True):
+        if exclude_date and exclude_date in stem:
             continue
-        return snapshot
+        return snapshots[stem]
 
     return None
 
 
 def load_snapshot(path: Path) -> pd.DataFrame:
-    """Load a snapshot CSV file.
+    """Load a snapshot CSV or Parquet file.
+
+    For a CSV, reads the Parquet sidecar written alongside the snapshot when
+    it is up to date; otherwise parses the CSV with every column as a
+    string, which skips per-column type inference and matches the
+    sidecar's types.
 
     Args:
-        path: Path to CSV file
+        path: Path to CSV or Parquet file
 
     Returns:
         DataFrame with snapshot data
     """
     logger.info(f"Loading snapshot: {path}")
-    return pd.read_csv(path)
+    if format_for_path(path) == "parquet":
+        return pd.read_parquet(path, engine="pyarrow")
+    sidecar = fresh_sidecar(path)
+    if sidecar is not None:
+        return pd.read_parquet(sidecar, engine="pyarrow")
+    return read_frame(path, as_strings=True)
+
+
+def _load_snapshot_head(path: Path) -> pd.DataFrame:
+    """Load only the first row of a snapshot CSV or Parquet file."""
+    if format_for_path(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        batch = next(pq.ParquetFile(path).iter_batches(batch_size=1), None)
+        return batch.to_pandas() if batch is not None else pd.DataFrame()
+    return pd.read_csv(path, nrows=1, dtype=str)
+
+
+def write_snapshot_digest(df: pd.DataFrame, path: Path) -> Path:
+    """Write the content digest for a saved snapshot.
+
+    Args:
+        df: Snapshot DataFrame as saved
+        path: Path to the snapshot CSV
+
+    Returns:
+        Path to the digest file
+    """
+    digest_file = digest_path(path)
+    digest_file.write_text(frame_digest(df, DIGEST_EXCLUDED_COLUMNS) + "\n")
+    return digest_file
+
+
+def compare_with_snapshot_file(
+    path: Path, current_df: pd.DataFrame
+) -> SnapshotDiff:
+    """Compare a DataFrame with a saved snapshot.
+
+    When the snapshot has an up-to-date digest equal to the DataFrame's,
+    the data is unchanged and an empty diff is returned without loading
+    the snapshot or running the comparison.
+
+    Args:
+        path: Path to the previous snapshot CSV or Parquet file
+        current_df: Current snapshot DataFrame
+
+    Returns:
+        SnapshotDiff with all detected changes
+    """
+    digest_file = digest_path(path)
+    if (
+        digest_file.exists()
+        and digest_file.stat().st_mtime >= path.stat().st_mtime
+        and digest_file.read_text().strip()
+        == frame_digest(current_df, DIGEST_EXCLUDED_COLUMNS)
+    ):
+        logger.info(f"Snapshot unchanged since {path.name}, skipping comparison")
+        return SnapshotDiff(
+            old_snapshot_date=_extract_snapshot_date(_load_snapshot_head(path)),
+            new_snapshot_date=_extract_snapshot_date(current_df),
+        )
+
+    return compare_snapshots(load_snapshot(path), current_df)
 
 
 def format_diff_as_text(diff: SnapshotDiff) -> str:
@@ -286,41 +370,52 @@ def format_diff_as_text(diff: SnapshotDiff) -> str:
     Returns:
         Formatted text string
     """
-    lines = []
-    lines.append("=" * 60)
-    lines.append("EDINBURGH FRINGE DAILY UPDATE")
-    lines.append(f"Comparing: {diff.old_snapshot_date} -> {diff.new_snapshot_date}")
-    lines.append("=" * 60)
-    lines.append("")
+    return "\n".join(iter_diff_as_text(diff))
+
+
+def iter_diff_as_text(diff: SnapshotDiff) -> Iterator[str]:
+    """Generate the plain text report line by line.
+
+    Args:
+        diff: SnapshotDiff to format
+
+    Yields:
+        Report lines, without trailing newlines
+    """
+    yield "=" * 60
+    yield "EDINBURGH FRINGE DAILY UPDATE"
+    yield f"Comparing: {diff.old_snapshot_date} -> {diff.new_snapshot_date}"
+    yield "=" * 60
+    yield ""
 
     if not diff.has_changes:
-        lines.append("No changes detected since last snapshot.")
-        return "\n".join(lines)
+        yield "No changes detected since last snapshot."
+        return
 
-    lines.append(f"Total changes: {diff.total_changes}")
-    lines.append("")
+    yield f"Total changes: {diff.total_changes}"
+    yield ""
 
     # New Shows
     if diff.new_shows:
-        lines.append("-" * 40)
-        lines.append(f"NEW SHOWS ({len(diff.new_shows)})")
-        lines.append("-" * 40)
+        yield "-" * 40
+        yield f"NEW SHOWS ({len(diff.new_shows)})"
+        yield "-" * 40
         for show in diff.new_shows:
-            lines.append(f"\n  {show.show_name}")
-            lines.append(f"    Performer: {show.performer}")
-            lines.append(f"    Performances: {show.performance_count}")
+            yield f"\n  {show.show_name}"
+            yield f"    Performer: {show.performer}"
+            yield f"    Performances: {show.performance_count}"
             if show.date_range:
-                lines.append(f"    Dates: {show.date_range}")
+                yield f"    Dates: {show.date_range}"
             if show.venues:
-                lines.append(f"    Venue: {', '.join(show.venues)}")
-            lines.append(f"    URL: {show.show_url}")
-        lines.append("")
+                yield f"    Venue: {', '.join(show.venues)}"
+            yield f"    URL: {show.show_url}"
+        yield ""
 
     # Sold Out
     if diff.sold_out_performances:
-        lines.append("-" * 40)
-        lines.append(f"SOLD OUT ({len(diff.sold_out_performances)})")
-        lines.append("-" * 40)
+        yield "-" * 40
+        yield f"SOLD OUT ({len(diff.sold_out_performances)})"
+        yield "-" * 40
         # Group by show
         by_show: dict[str, list[PerformanceChange]] = {}
         for perf in diff.sold_out_performances:
@@ -330,40 +425,40 @@ def format_diff_as_text(diff: SnapshotDiff) -> str:
             by_show[key].append(perf)
 
         for show_name, perfs in by_show.items():
-            lines.append(f"\n  {show_name}")
+            yield f"\n  {show_name}"
             for perf in perfs[:5]:  # Limit to 5 per show
-                lines.append(f"    - {perf.date} {perf.time}")
+                yield f"    - {perf.date} {perf.time}"
             if len(perfs) > 5:
-                lines.append(f"    ... and {len(perfs) - 5} more")
-        lines.append("")
+                yield f"    ... and {len(perfs) - 5} more"
+        yield ""
 
     # Cancelled
     if diff.cancelled_performances:
-        lines.append("-" * 40)
-        lines.append(f"CANCELLED ({len(diff.cancelled_performances)})")
-        lines.append("-" * 40)
+        yield "-" * 40
+        yield f"CANCELLED ({len(diff.cancelled_performances)})"
+        yield "-" * 40
         for perf in diff.cancelled_performances[:10]:
-            lines.append(f"  {perf.show_name} - {perf.date} {perf.time}")
+            yield f"  {perf.show_name} - {perf.date} {perf.time}"
         if len(diff.cancelled_performances) > 10:
-            lines.append(f"  ... and {len(diff.cancelled_performances) - 10} more")
-        lines.append("")
+            yield f"  ... and {len(diff.cancelled_performances) - 10} more"
+        yield ""
 
     # Back Available
     if diff.back_available:
-        lines.append("-" * 40)
-        lines.append(f"BACK AVAILABLE ({len(diff.back_available)})")
-        lines.append("-" * 40)
+        yield "-" * 40
+        yield f"BACK AVAILABLE ({len(diff.back_available)})"
+        yield "-" * 40
         for perf in diff.back_available[:10]:
-            lines.append(f"  {perf.show_name} - {perf.date} {perf.time}")
+            yield f"  {perf.show_name} - {perf.date} {perf.time}"
         if len(diff.back_available) > 10:
-            lines.append(f"  ... and {len(diff.back_available) - 10} more")
-        lines.append("")
+            yield f"  ... and {len(diff.back_available) - 10} more"
+        yield ""
 
     # New Performances
     if diff.new_performances:
-        lines.append("-" * 40)
-        lines.append(f"NEW PERFORMANCES FOR EXISTING SHOWS ({len(diff.new_performances)})")
-        lines.append("-" * 40)
+        yield "-" * 40
+        yield f"NEW PERFORMANCES FOR EXISTING SHOWS ({len(diff.new_performances)})"
+        yield "-" * 40
         # Group by show
         by_show = {}
         for perf in diff.new_performances:
@@ -373,27 +468,25 @@ def format_diff_as_text(diff: SnapshotDiff) -> str:
             by_show[key].append(perf)
 
         for show_name, perfs in list(by_show.items())[:10]:
-            lines.append(f"\n  {show_name}")
+            yield f"\n  {show_name}"
             for perf in perfs[:3]:
-                lines.append(f"    + {perf.date} {perf.time} @ {perf.venue}")
+                yield f"    + {perf.date} {perf.time} @ {perf.venue}"
             if len(perfs) > 3:
-                lines.append(f"    ... and {len(perfs) - 3} more performances")
+                yield f"    ... and {len(perfs) - 3} more performances"
         if len(by_show) > 10:
-            lines.append(f"\n  ... and {len(by_show) - 10} more shows with new performances")
-        lines.append("")
+            yield f"\n  ... and {len(by_show) - 10} more shows with new performances"
+        yield ""
 
     # Removed Shows
     if diff.removed_shows:
-        lines.append("-" * 40)
-        lines.append(f"REMOVED SHOWS ({len(diff.removed_shows)})")
-        lines.append("-" * 40)
+        yield "-" * 40
+        yield f"REMOVED SHOWS ({len(diff.removed_shows)})"
+        yield "-" * 40
         for show in diff.removed_shows[:10]:
-            lines.append(f"  {show.show_name} ({show.performance_count} performances)")
+            yield f"  {show.show_name} ({show.performance_count} performances)"
         if len(diff.removed_shows) > 10:
-            lines.append(f"  ... and {len(diff.removed_shows) - 10} more")
-        lines.append("")
-
-    return "\n".join(lines)
+            yield f"  ... and {len(diff.removed_shows) - 10} more"
+        yield ""
 
 
 def format_diff_as_html(diff: SnapshotDiff) -> str:
@@ -405,8 +498,19 @@ def format_diff_as_html(diff: SnapshotDiff) -> str:
     Returns:
         HTML string
     """
-    html = []
-    html.append("""
+    return "\n".join(iter_diff_as_html(diff))
+
+
+def iter_diff_as_html(diff: SnapshotDiff) -> Iterator[str]:
+    """Generate the HTML report chunk by chunk.
+
+    Args:
+        diff: SnapshotDiff to format
+
+    Yields:
+        HTML fragments, to be joined with newlines
+    """
+    yield """
 <!DOCTYPE html>
 <html>
 <head>
@@ -431,50 +535,50 @@ a { color: #7B2D8E; }
 </style>
 </head>
 <body>
-""")
+"""
 
-    html.append(f"<h1>Edinburgh Fringe Daily Update</h1>")
-    html.append(f"<p><em>Comparing: {diff.old_snapshot_date} &rarr; {diff.new_snapshot_date}</em></p>")
+    yield f"<h1>Edinburgh Fringe Daily Update</h1>"
+    yield f"<p><em>Comparing: {diff.old_snapshot_date} &rarr; {diff.new_snapshot_date}</em></p>"
 
     if not diff.has_changes:
-        html.append("<p>No changes detected since last snapshot.</p>")
-        html.append("</body></html>")
-        return "\n".join(html)
+        yield "<p>No changes detected since last snapshot.</p>"
+        yield "</body></html>"
+        return
 
     # Summary
-    html.append('<div class="summary">')
-    html.append("<strong>Summary:</strong><br>")
+    yield '<div class="summary">'
+    yield "<strong>Summary:</strong><br>"
     if diff.new_shows:
-        html.append(f'<span class="new">{len(diff.new_shows)} new shows</span><br>')
+        yield f'<span class="new">{len(diff.new_shows)} new shows</span><br>'
     if diff.sold_out_performances:
-        html.append(f'<span class="sold-out">{len(diff.sold_out_performances)} performances sold out</span><br>')
+        yield f'<span class="sold-out">{len(diff.sold_out_performances)} performances sold out</span><br>'
     if diff.cancelled_performances:
-        html.append(f'<span class="cancelled">{len(diff.cancelled_performances)} performances cancelled</span><br>')
+        yield f'<span class="cancelled">{len(diff.cancelled_performances)} performances cancelled</span><br>'
     if diff.back_available:
-        html.append(f'<span class="back">{len(diff.back_available)} back available</span><br>')
+        yield f'<span class="back">{len(diff.back_available)} back available</span><br>'
     if diff.new_performances:
-        html.append(f'{len(diff.new_performances)} new performances added<br>')
-    html.append("</div>")
+        yield f'{len(diff.new_performances)} new performances added<br>'
+    yield "</div>"
 
     # New Shows
     if diff.new_shows:
-        html.append(f'<h2 class="new">New Shows ({len(diff.new_shows)})</h2>')
+        yield f'<h2 class="new">New Shows ({len(diff.new_shows)})</h2>'
         for show in diff.new_shows:
-            html.append('<div class="show">')
-            html.append(f'<div class="show-title"><a href="{show.show_url}">{show.show_name}</a> <span class="badge badge-new">NEW</span></div>')
-            html.append(f'<div class="show-meta">')
-            html.append(f'Performer: {show.performer}<br>')
-            html.append(f'{show.performance_count} performances')
+            yield '<div class="show">'
+            yield f'<div class="show-title"><a href="{show.show_url}">{show.show_name}</a> <span class="badge badge-new">NEW</span></div>'
+            yield f'<div class="show-meta">'
+            yield f'Performer: {show.performer}<br>'
+            yield f'{show.performance_count} performances'
             if show.date_range:
-                html.append(f' | {show.date_range}')
+                yield f' | {show.date_range}'
             if show.venues:
-                html.append(f'<br>Venue: {", ".join(show.venues)}')
-            html.append('</div>')
-            html.append('</div>')
+                yield f'<br>Venue: {", ".join(show.venues)}'
+            yield '</div>'
+            yield '</div>'
 
     # Sold Out
     if diff.sold_out_performances:
-        html.append(f'<h2 class="sold-out">Sold Out ({len(diff.sold_out_performances)})</h2>')
+        yield f'<h2 class="sold-out">Sold Out ({len(diff.sold_out_performances)})</h2>'
         by_show: dict[str, list[PerformanceChange]] = {}
         for perf in diff.sold_out_performances:
             if perf.show_name not in by_show:
@@ -482,34 +586,34 @@ a { color: #7B2D8E; }
             by_show[perf.show_name].append(perf)
 
         for show_name, perfs in by_show.items():
-            html.append('<div class="show">')
-            html.append(f'<div class="show-title"><a href="{perfs[0].show_url}">{show_name}</a> <span class="badge badge-soldout">SOLD OUT</span></div>')
-            html.append('<ul class="performance-list">')
+            yield '<div class="show">'
+            yield f'<div class="show-title"><a href="{perfs[0].show_url}">{show_name}</a> <span class="badge badge-soldout">SOLD OUT</span></div>'
+            yield '<ul class="performance-list">'
             for perf in perfs[:5]:
-                html.append(f'<li>{perf.date} {perf.time}</li>')
+                yield f'<li>{perf.date} {perf.time}</li>'
             if len(perfs) > 5:
-                html.append(f'<li><em>... and {len(perfs) - 5} more</em></li>')
-            html.append('</ul></div>')
+                yield f'<li><em>... and {len(perfs) - 5} more</em></li>'
+            yield '</ul></div>'
 
     # Cancelled
     if diff.cancelled_performances:
-        html.append(f'<h2 class="cancelled">Cancelled ({len(diff.cancelled_performances)})</h2>')
+        yield f'<h2 class="cancelled">Cancelled ({len(diff.cancelled_performances)})</h2>'
         for perf in diff.cancelled_performances[:10]:
-            html.append(f'<div class="show"><a href="{perf.show_url}">{perf.show_name}</a> - {perf.date} {perf.time}</div>')
+            yield f'<div class="show"><a href="{perf.show_url}">{perf.show_name}</a> - {perf.date} {perf.time}</div>'
         if len(diff.cancelled_performances) > 10:
-            html.append(f'<p><em>... and {len(diff.cancelled_performances) - 10} more</em></p>')
+            yield f'<p><em>... and {len(diff.cancelled_performances) - 10} more</em></p>'
 
     # Back Available
     if diff.back_available:
-        html.append(f'<h2 class="back">Back Available ({len(diff.back_available)})</h2>')
+        yield f'<h2 class="back">Back Available ({len(diff.back_available)})</h2>'
         for perf in diff.back_available[:10]:
-            html.append(f'<div class="show"><a href="{perf.show_url}">{perf.show_name}</a> - {perf.date} {perf.time}</div>')
+            yield f'<div class="show"><a href="{perf.show_url}">{perf.show_name}</a> - {perf.date} {perf.time}</div>'
         if len(diff.back_available) > 10:
-            html.append(f'<p><em>... and {len(diff.back_available) - 10} more</em></p>')
+            yield f'<p><em>... and {len(diff.back_available) - 10} more</em></p>'
 
     # New Performances
     if diff.new_performances:
-        html.append(f'<h2>New Performances ({len(diff.new_performances)})</h2>')
+        yield f'<h2>New Performances ({len(diff.new_performances)})</h2>'
         by_show = {}
         for perf in diff.new_performances:
             if perf.show_name not in by_show:
@@ -517,16 +621,15 @@ a { color: #7B2D8E; }
             by_show[perf.show_name].append(perf)
 
         for show_name, perfs in list(by_show.items())[:10]:
-            html.append('<div class="show">')
-            html.append(f'<div class="show-title"><a href="{perfs[0].show_url}">{show_name}</a></div>')
-            html.append('<ul class="performance-list">')
+            yield '<div class="show">'
+            yield f'<div class="show-title"><a href="{perfs[0].show_url}">{show_name}</a></div>'
+            yield '<ul class="performance-list">'
             for perf in perfs[:3]:
-                html.append(f'<li>{perf.date} {perf.time} @ {perf.venue}</li>')
+                yield f'<li>{perf.date} {perf.time} @ {perf.venue}</li>'
             if len(perfs) > 3:
-                html.append(f'<li><em>... and {len(perfs) - 3} more</em></li>')
-            html.append('</ul></div>')
+                yield f'<li><em>... and {len(perfs) - 3} more</em></li>'
+            yield '</ul></div>'
         if len(by_show) > 10:
-            html.append(f'<p><em>... and {len(by_show) - 10} more shows</em></p>')
+            yield f'<p><em>... and {len(by_show) - 10} more shows</em></p>'
 
-    html.append("</body></html>")
-    return "\n".join(html)
+    yield "</body></html>"
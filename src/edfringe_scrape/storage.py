@@ -0,0 +1,281 @@
+"""Reading and writing tabular data files.
+
+Files are read and written as CSV, Parquet or Feather, chosen from the
+file extension. CSV stays the interchange format for downstream tools;
+Parquet and Feather are columnar and much faster to reload.
+
+CSVs written by the scraper get a Parquet sidecar (same stem, ``.parquet``
+extension) so later reads can skip CSV parsing and dtype inference.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import logging
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ("csv", "parquet", "feather")
+
+# pandas output is the reference format downstream tools parse. pyarrow's
+# C++ writer is faster but quotes every string field (and the header) and
+# prints timestamps/floats differently, so it is opt-in.
+CSV_ENGINES = ("pandas", "pyarrow")
+
+# Buffer size for pandas CSV writes
+_CSV_WRITE_BUFFER = 1 << 20
+
+# Strings pd.read_csv treats as missing by default
+_CSV_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+
+def ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) if it does not exist.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        The same path
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def format_for_path(path: Path) -> str:
+    """Infer the file format from a path's extension.
+
+    Args:
+        path: File path
+
+    Returns:
+        One of OUTPUT_FORMATS (unknown extensions are treated as CSV)
+    """
+    suffix = path.suffix.lower().lstrip(".")
+    return suffix if suffix in OUTPUT_FORMATS else "csv"
+
+
+def write_frame(
+    df: pd.DataFrame,
+    path: Path,
+    fmt: str | None = None,
+    csv_engine: str = "pandas",
+) -> Path:
+    """Write a DataFrame without its index.
+
+    The data is written to a temporary file next to the target and renamed
+    into place, so readers never see a partially written file.
+
+    Args:
+        df: DataFrame to write
+        path: Output file path
+        fmt: One of OUTPUT_FORMATS (inferred from the extension if None)
+        csv_engine: One of CSV_ENGINES, used when writing CSV
+
+    Returns:
+        Path to written file
+    """
+    fmt = fmt or format_for_path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    try:
+        _write_frame_to(df, tmp_path, fmt, csv_engine)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    logger.debug(f"Wrote {len(df)} rows to {path} ({fmt})")
+    return path
+
+
+def _write_frame_to(df: pd.DataFrame, path: Path, fmt: str, csv_engine: str) -> None:
+    """Write a DataFrame in the given format (no atomic rename)."""
+    if fmt == "parquet":
+        df.to_parquet(path, engine="pyarrow", compression="snappy", index=False)
+    elif fmt == "feather":
+        df.reset_index(drop=True).to_feather(path)
+    elif csv_engine == "pyarrow":
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # pandas writes midnight-only datetimes as plain dates; do the same
+        for name in df.select_dtypes("datetime").columns:
+            values = df[name].dropna()
+            if (values == values.dt.normalize()).all():
+                idx = table.schema.get_field_index(name)
+                table = table.set_column(
+                    idx, name, table.column(name).cast(pa.date32())
+                )
+        pacsv.write_csv(table, path)
+    else:
+        # "\n" line endings on every platform, so output is byte-identical
+        with open(
+            path, "w", encoding="utf-8", newline="", buffering=_CSV_WRITE_BUFFER
+        ) as fh:
+            df.to_csv(fh, index=False, lineterminator="\n")
+
+
+def sidecar_path(path: Path) -> Path:
+    """Get the Parquet sidecar path for a CSV file.
+
+    Args:
+        path: CSV file path
+
+    Returns:
+        Path with the extension replaced by .parquet
+    """
+    return path.with_suffix(".parquet")
+
+
+def fresh_sidecar(path: Path) -> Path | None:
+    """Find a Parquet sidecar that is at least as new as its CSV.
+
+    Args:
+        path: CSV file path
+
+    Returns:
+        Sidecar path, or None if there is no sidecar or it is stale
+    """
+    sidecar = sidecar_path(path)
+    if sidecar.exists() and sidecar.stat().st_mtime >= path.stat().st_mtime:
+        return sidecar
+    return None
+
+
+def write_csv_with_sidecar(
+    df: pd.DataFrame, path: Path, csv_engine: str = "pandas"
+) -> Path:
+    """Write a DataFrame as CSV plus a Parquet sidecar.
+
+    Empty strings are stored as nulls in the sidecar so that reading it
+    gives the same missing values as reading the CSV.
+
+    Args:
+        df: DataFrame to write
+        path: CSV output path
+        csv_engine: One of CSV_ENGINES
+
+    Returns:
+        Path to the written CSV
+    """
+    write_frame(df, path, fmt="csv", csv_engine=csv_engine)
+    write_frame(df.replace("", None), sidecar_path(path), fmt="parquet")
+    return path
+
+
+def digest_path(path: Path) -> Path:
+    """Get the content digest path for a data file.
+
+    Args:
+        path: Data file path
+
+    Returns:
+        Path with the extension replaced by .sha256
+    """
+    return path.with_suffix(".sha256")
+
+
+def frame_digest(df: pd.DataFrame, exclude_columns: Iterable[str] = ()) -> str:
+    """Compute a SHA-256 digest of a DataFrame's values.
+
+    The digest depends on column names, row order and values but not on
+    dtypes, so a categorical column hashes the same as its string form.
+
+    Args:
+        df: DataFrame to hash
+        exclude_columns: Columns to leave out (e.g. per-run timestamps)
+
+    Returns:
+        Hex digest string
+    """
+    import pandas as pd
+
+    df = df.drop(columns=list(exclude_columns), errors="ignore")
+    digest = hashlib.sha256("\x1f".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def read_frame(
+    path: Path, prefer_sidecar: bool = False, as_strings: bool = False
+) -> pd.DataFrame:
+    """Read a DataFrame written by write_frame (or any CSV).
+
+    Args:
+        path: Input file path
+        prefer_sidecar: For CSV paths, read the Parquet sidecar instead when
+            one exists and is at least as new as the CSV
+        as_strings: For CSV paths, read every column as text. This skips
+            type inference and uses pyarrow's multithreaded parser.
+
+    Returns:
+        DataFrame with file contents
+    """
+    import pandas as pd
+
+    fmt = format_for_path(path)
+
+    if prefer_sidecar and fmt == "csv":
+        sidecar = fresh_sidecar(path)
+        if sidecar is not None:
+            logger.debug(f"Reading Parquet sidecar {sidecar}")
+            return pd.read_parquet(sidecar, engine="pyarrow")
+
+    if fmt == "parquet":
+        return pd.read_parquet(path, engine="pyarrow")
+    if fmt == "feather":
+        return pd.read_feather(path)
+    if as_strings:
+        return _read_csv_as_strings(path)
+    return pd.read_csv(path)
+
+
+def _read_csv_as_strings(path: Path) -> pd.DataFrame:
+    """Read a CSV with pyarrow, typing every column as a string.
+
+    Gives the same frame as pd.read_csv(path, dtype=str). The pandas
+    pyarrow engine is not used because it infers types before casting to
+    str, which reformats values such as timestamps.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    with open(path, newline="", encoding="utf-8") as fh:
+        header = next(csv.reader(fh), [])
+
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in header},
+        null_values=_CSV_NA_VALUES,
+        strings_can_be_null=True,
+    )
+    return pacsv.read_csv(path, convert_options=convert_options).to_pandas()
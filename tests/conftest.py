@@ -1,8 +1,10 @@
 """Shared test fixtures."""
 
+from collections.abc import Iterator
+
 import pytest
 
-from edfringe_scrape.config import Settings
+from edfringe_scrape.config import Settings, reset_settings
 
 
 @pytest.fixture
@@ -16,8 +18,8 @@ def test_settings() -> Settings:
 
 
 @pytest.fixture(autouse=True)
-def reset_environment(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Reset environment variables for each test."""
+def reset_environment(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Reset environment variables and cached settings for each test."""
     monkeypatch.delenv("EDFRINGE_DEBUG", raising=False)
     monkeypatch.delenv("EDFRINGE_LOG_LEVEL", raising=False)
     monkeypatch.delenv("EDFRINGE_BASE_URL", raising=False)
@@ -26,3 +28,6 @@ def reset_environment(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("EDFRINGE_REQUEST_DELAY_MS", raising=False)
     monkeypatch.delenv("EDFRINGE_JS_WAIT_MS", raising=False)
     monkeypatch.delenv("EDFRINGE_DEFAULT_YEAR", raising=False)
+    reset_settings()
+    yield
+    reset_settings()
@@ -0,0 +1,81 @@
+"""Tests for the fetched-page response cache."""
+
+import sqlite3
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from edfringe_scrape.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test ResponseCache storage and expiry."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test a stored page is returned while fresh."""
+        cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds=60)
+        key = ResponseCache.make_key("https://example.com", dynamic=True)
+        cache.set(key, "<html>hi</html>")
+        assert cache.get(key) == "<html>hi</html>"
+        cache.close()
+
+    def test_missing_key(self, tmp_path: Path) -> None:
+        """Test an unknown key is a miss."""
+        cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds=60)
+        assert cache.get("dynamic:https://example.com") is None
+        cache.close()
+
+    def test_expired_entry(self, tmp_path: Path) -> None:
+        """Test entries older than the TTL are ignored."""
+        cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds=60)
+        with patch("edfringe_scrape.cache.time.time", return_value=1000.0):
+            cache.set("k", "<html></html>")
+        with patch("edfringe_scrape.cache.time.time", return_value=1061.0):
+            assert cache.get("k") is None
+        cache.close()
+
+    def test_render_mode_in_key(self) -> None:
+        """Test static and dynamic fetches of a URL are cached separately."""
+        url = "https://example.com"
+        assert ResponseCache.make_key(url, True) != ResponseCache.make_key(url, False)
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Test pages survive reopening the database."""
+        path = tmp_path / "cache.sqlite"
+        cache = ResponseCache(path, ttl_seconds=60)
+        cache.set("k", "<html></html>")
+        cache.close()
+
+        reopened = ResponseCache(path, ttl_seconds=60)
+        assert reopened.get("k") == "<html></html>"
+        reopened.close()
+
+    def test_stores_compressed(self, tmp_path: Path) -> None:
+        """Test page bodies are stored compressed."""
+        path = tmp_path / "cache.sqlite"
+        cache = ResponseCache(path, ttl_seconds=60)
+        html = "<html>" + "<div>show</div>" * 500 + "</html>"
+        cache.set("k", html)
+        cache.close()
+
+        conn = sqlite3.connect(path)
+        (stored,) = conn.execute("SELECT html FROM responses").fetchone()
+        conn.close()
+        assert isinstance(stored, bytes)
+        assert len(stored) < len(html) // 10
+
+    def test_reads_uncompressed_entries(self, tmp_path: Path) -> None:
+        """Test plain-text entries from older caches are still returned."""
+        path = tmp_path / "cache.sqlite"
+        ResponseCache(path, ttl_seconds=60).close()
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "INSERT INTO responses VALUES (?, ?, ?)",
+            ("k", "<html></html>", time.time()),
+        )
+        conn.commit()
+        conn.close()
+
+        cache = ResponseCache(path, ttl_seconds=60)
+        assert cache.get("k") == "<html></html>"
+        cache.close()
@@ -1,8 +1,26 @@
 """Tests for CLI commands."""
 
+import subprocess
+import sys
+from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
 from click.testing import CliRunner
 
-from edfringe_scrape.cli import cli
+from edfringe_scrape.cli import (
+    _progressbar,
+    _scrape_all_genres,
+    _send_update_email,
+    cli,
+)
+from edfringe_scrape.config import Settings
+from edfringe_scrape.core import FringeScraper
+from edfringe_scrape.models import Genre, PerformanceDetail, ScrapedShow
+from edfringe_scrape.scraper import ScrapingDogError
+from edfringe_scrape.snapshot import SnapshotDiff
 
 
 class TestCLI:
@@ -47,3 +65,289 @@ class TestCLI:
         result = runner.invoke(cli, ["update"])
         assert result.exit_code != 0
         assert "API key not configured" in result.output
+
+    @pytest.mark.parametrize(
+        ("args", "expected_ttl"),
+        [([], 6.0), (["--cache-ttl", "12"], 12.0), (["--no-cache"], 0.0)],
+    )
+    def test_update_cache_options(
+        self, monkeypatch: pytest.MonkeyPatch, args: list[str], expected_ttl: float
+    ) -> None:
+        """Test --cache-ttl and --no-cache override the configured TTL."""
+        monkeypatch.setenv("EDFRINGE_SCRAPINGDOG_API_KEY", "test_key")
+        monkeypatch.setenv("EDFRINGE_RESPONSE_CACHE_TTL_HOURS", "6")
+        with patch(
+            "edfringe_scrape.core.FringeScraper",
+            side_effect=RuntimeError("stop after setup"),
+        ) as mock_scraper:
+            CliRunner().invoke(cli, ["update", *args])
+
+        settings = mock_scraper.call_args.args[0]
+        assert settings.response_cache_ttl_hours == expected_ttl
+
+    def test_update_closes_scraper_on_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the scraper's connections are closed when scraping fails."""
+        monkeypatch.setenv("EDFRINGE_SCRAPINGDOG_API_KEY", "test_key")
+        monkeypatch.setenv("EDFRINGE_RESPONSE_CACHE_TTL_HOURS", "0")
+        with (
+            patch(
+                "edfringe_scrape.cli._scrape_all_genres",
+                side_effect=ScrapingDogError("API down"),
+            ),
+            patch.object(FringeScraper, "close") as mock_close,
+        ):
+            result = CliRunner().invoke(cli, ["update"])
+
+        assert isinstance(result.exception, ScrapingDogError)
+        mock_close.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("output_format", "marker"),
+        [("text", "EDINBURGH FRINGE DAILY UPDATE"), ("html", "</body></html>")],
+    )
+    def test_compare_writes_report(
+        self, tmp_path: Path, output_format: str, marker: str
+    ) -> None:
+        """Test compare streams the report to the output file."""
+        old = tmp_path / "old.csv"
+        new = tmp_path / "new.csv"
+        df = pd.DataFrame(
+            {
+                "show-link-href": ["https://edfringe.com/a"],
+                "show-name": ["Show A"],
+                "date": ["Monday 10 August"],
+                "performance-time": ["19:30"],
+                "show-availability": ["TICKETS_AVAILABLE"],
+            }
+        )
+        df.to_csv(old, index=False)
+        df.assign(**{"show-availability": "SOLD_OUT"}).to_csv(new, index=False)
+        report = tmp_path / f"report.{output_format}"
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "compare",
+                str(old),
+                str(new),
+                "--format",
+                output_format,
+                "-o",
+                str(report),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        content = report.read_text(encoding="utf-8")
+        assert marker in content
+        assert "Show A" in content
+        assert content.endswith("\n")
+
+
+class TestProgressbar:
+    """Test progress bar redraw throttling."""
+
+    @pytest.mark.parametrize(
+        ("length", "expected_steps"), [(None, 10), (50, 1), (10_000, 50)]
+    )
+    def test_update_min_steps(self, length: int | None, expected_steps: int) -> None:
+        """Test bars redraw in bounded steps, even without a known length."""
+        bar = _progressbar("  Processing", length=length, iterable=iter([]))
+        assert bar.update_min_steps == expected_steps
+
+
+class TestStartup:
+    """Test CLI import cost."""
+
+    def test_import_does_not_load_pandas(self) -> None:
+        """Test importing the CLI defers pandas until a command needs it."""
+        code = "import sys, edfringe_scrape.cli; sys.exit('pandas' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+        assert result.returncode == 0
+
+    def test_info_does_not_load_heavy_modules(self) -> None:
+        """Test info runs without pandas, the scraper or converter modules."""
+        code = (
+            "import sys\n"
+            "from edfringe_scrape.cli import cli\n"
+            "try:\n"
+            "    cli(['info'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "heavy = ('pandas', 'httpx', 'bs4', 'edfringe_scrape.converter',\n"
+            "         'edfringe_scrape.snapshot', 'edfringe_scrape.email_sender')\n"
+            "sys.exit(any(m in sys.modules for m in heavy))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=False
+        )
+        assert result.returncode == 0
+
+    def test_help_does_not_load_settings(self) -> None:
+        """Test --help skips importing pydantic-settings."""
+        code = (
+            "import sys\n"
+            "from edfringe_scrape.cli import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "sys.exit('pydantic_settings' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=False
+        )
+        assert result.returncode == 0
+
+    def test_compare_does_not_load_settings(self, tmp_path: Path) -> None:
+        """Test compare runs without reading settings from the environment."""
+        snapshot = tmp_path / "2026-02-10-full-snapshot.csv"
+        pd.DataFrame(
+            {"show-link-href": ["https://edfringe.com/a"], "date": ["Monday 10 August"]}
+        ).to_csv(snapshot, index=False)
+        code = (
+            "import sys\n"
+            "from edfringe_scrape.cli import cli\n"
+            "try:\n"
+            f"    cli(['compare', {str(snapshot)!r}, {str(snapshot)!r}])\n"
+            "except SystemExit as e:\n"
+            "    assert not e.code, e.code\n"
+            "sys.exit('pydantic_settings' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=False
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_module_entry_point(self) -> None:
+        """Test the package runs with python -m."""
+        result = subprocess.run(
+            [sys.executable, "-m", "edfringe_scrape", "--help"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0
+        assert "Usage:" in result.stdout
+
+
+class TestMultiFileCommands:
+    """Test convert and export with several input files."""
+
+    @staticmethod
+    def _write_raw(path: Path) -> Path:
+        """Write a minimal raw scrape CSV."""
+        pd.DataFrame(
+            {
+                "show-link-href": ["https://edfringe.com/shows/1"],
+                "show-link": ["Show One"],
+                "show-name": ["Show One"],
+                "show-performer": ["Performer A"],
+                "date": ["Wednesday 30 July"],
+                "performance-time": ["19:30"],
+                "show-availability": ["Available"],
+                "show-location": ["Venue A"],
+            }
+        ).to_csv(path, index=False)
+        return path
+
+    def test_convert_multiple_files_in_parallel(self, tmp_path: Path) -> None:
+        """Test convert handles several inputs with worker processes."""
+        inputs = [self._write_raw(tmp_path / f"raw{i}.csv") for i in range(2)]
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ["convert", *map(str, inputs), "--formats", "summary", "--jobs", "2"],
+        )
+        assert result.exit_code == 0, result.output
+        for i in range(2):
+            assert (tmp_path / f"Summary-raw{i}.csv").exists()
+
+    def test_export_multiple_files(self, tmp_path: Path) -> None:
+        """Test export writes one output per input."""
+        inputs = [self._write_raw(tmp_path / f"raw{i}.csv") for i in range(2)]
+        runner = CliRunner()
+        result = runner.invoke(cli, ["export", *map(str, inputs)])
+        assert result.exit_code == 0, result.output
+        for i in range(2):
+            assert (tmp_path / f"raw{i}-festival-planner.csv").exists()
+
+    def test_export_output_requires_single_input(self, tmp_path: Path) -> None:
+        """Test -o is rejected when exporting several files."""
+        inputs = [self._write_raw(tmp_path / f"raw{i}.csv") for i in range(2)]
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["export", *map(str, inputs), "-o", str(tmp_path / "out.csv")]
+        )
+        assert result.exit_code != 0
+        assert "single input file" in result.output
+
+
+class TestScrapeAllGenres:
+    """Test scraping several genres into combined DataFrames."""
+
+    def test_counts_dated_performances(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test per-genre counts skip the undated row of a show without dates."""
+        shows = {
+            Genre.COMEDY: [
+                ScrapedShow(
+                    title="Show A",
+                    url="https://edfringe.com/a",
+                    performances=[
+                        PerformanceDetail(date=date(2026, 8, 1)),
+                        PerformanceDetail(date=date(2026, 8, 2)),
+                    ],
+                ),
+                ScrapedShow(title="Show B", url="https://edfringe.com/b"),
+            ],
+            Genre.MUSIC: [
+                ScrapedShow(
+                    title="Show C",
+                    url="https://edfringe.com/c",
+                    performances=[PerformanceDetail(date=date(2026, 8, 3))],
+                )
+            ],
+        }
+        scraper = MagicMock()
+        scraper.fetch_shows_with_details.side_effect = (
+            lambda cards, genre, max_workers: enumerate(shows[genre])
+        )
+
+        perf_df, _, _ = _scrape_all_genres(
+            scraper,
+            ["COMEDY", "MUSIC"],
+            Settings(),
+            datetime(2026, 8, 1, 6, 0),
+            max_shows=None,
+            recently_added=None,
+        )
+
+        output = capsys.readouterr().out
+        assert "2 shows, 2 performances" in output
+        assert "1 shows, 1 performances" in output
+        assert list(perf_df["genre"]) == ["COMEDY", "COMEDY", "COMEDY", "MUSIC"]
+
+
+class TestUpdateEmail:
+    """Test the update command's email report."""
+
+    def test_reuses_text_report(self) -> None:
+        """Test the printed text report is sent as-is, not formatted again."""
+        settings = Settings(
+            email_to="to@example.com", smtp_user="user", smtp_password="secret"
+        )
+        diff = SnapshotDiff(old_snapshot_date="a", new_snapshot_date="b")
+
+        with (
+            patch("edfringe_scrape.email_sender.send_email") as mock_send,
+            patch("edfringe_scrape.snapshot.format_diff_as_text") as mock_text,
+        ):
+            _send_update_email(settings, diff, "2026-08-10", "printed report")
+
+        mock_text.assert_not_called()
+        assert mock_send.call_args.kwargs["text_body"] == "printed report"
+        assert "</html>" in mock_send.call_args.kwargs["html_body"]
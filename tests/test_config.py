@@ -2,7 +2,7 @@
 
 import pytest
 
-from edfringe_scrape.config import Settings
+from edfringe_scrape.config import Settings, get_settings, reset_settings
 
 
 class TestSettings:
@@ -41,3 +41,32 @@ class TestSettings:
         assert settings.request_delay_ms == 3000
         assert settings.js_wait_ms == 10000
         assert settings.default_year == 2026
+
+    def test_snapshot_csv_engine(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test snapshot CSV engine defaults to pandas and rejects unknowns."""
+        assert Settings().snapshot_csv_engine == "pandas"
+
+        monkeypatch.setenv("EDFRINGE_SNAPSHOT_CSV_ENGINE", "pyarrow")
+        assert Settings().snapshot_csv_engine == "pyarrow"
+
+        monkeypatch.setenv("EDFRINGE_SNAPSHOT_CSV_ENGINE", "polars")
+        with pytest.raises(ValueError):
+            Settings()
+
+
+class TestGetSettings:
+    """Test the cached settings accessor."""
+
+    def test_returns_same_instance(self) -> None:
+        """Test settings are parsed once and reused."""
+        assert get_settings() is get_settings()
+
+    def test_reset_rereads_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test reset_settings picks up environment changes."""
+        assert get_settings().request_delay_ms == 2000
+
+        monkeypatch.setenv("EDFRINGE_REQUEST_DELAY_MS", "500")
+        assert get_settings().request_delay_ms == 2000
+
+        reset_settings()
+        assert get_settings().request_delay_ms == 500
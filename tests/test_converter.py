@@ -2,11 +2,17 @@
 
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
-from edfringe_scrape.converter import FringeConverter, save_all_formats
+from edfringe_scrape.converter import (
+    COMPANY_PATTERNS,
+    SUBTITLE_PATTERNS,
+    FringeConverter,
+    save_all_formats,
+)
 
 
 class TestFringeConverter:
@@ -52,6 +58,38 @@ class TestFringeConverter:
         result = converter._parse_date("")
         assert result is None
 
+    def test_parse_dates_matches_parse_date(self, converter: FringeConverter) -> None:
+        """Test the vectorized parser agrees with the scalar one."""
+        raw = pd.Series(
+            ["Wednesday 30 July"] * 3
+            + ["Friday 1 August", "Saturday 31 June", "bad", "", None]
+        )
+        result = converter._parse_dates(raw)
+
+        assert result.dtype == "datetime64[s]"
+        expected = [converter._parse_date(value) for value in raw]
+        actual = [None if pd.isna(d) else d.strftime("%Y-%m-%d") for d in result]
+        assert actual == expected
+
+    def test_format_dates_matches_strftime(self, converter: FringeConverter) -> None:
+        """Test formatting distinct dates agrees with dt.strftime."""
+        dates = pd.Series(
+            pd.to_datetime(["2025-08-01", None, "2025-08-02", "2025-08-01"])
+        )
+        result = converter._format_dates(dates)
+        expected = dates.dt.strftime("%Y-%m-%d")
+        pd.testing.assert_series_equal(result, expected, check_dtype=False)
+
+    def test_load_raw_parquet(
+        self, converter: FringeConverter, sample_df: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        """Test raw data can be loaded from Parquet."""
+        path = tmp_path / "raw.parquet"
+        sample_df.to_parquet(path, index=False)
+        result = converter.load_raw_csv(path)
+        assert len(result) == 3
+        assert list(result.columns) == list(sample_df.columns)
+
     def test_create_hyperlink(self, converter: FringeConverter) -> None:
         """Test creating Excel hyperlink."""
         result = converter._create_hyperlink("https://example.com", "Example")
@@ -62,6 +100,16 @@ class TestFringeConverter:
         result = converter._create_hyperlink("https://example.com", 'Show "Title"')
         assert '""' in result
 
+    def test_create_hyperlinks_matches_scalar(self, converter: FringeConverter) -> None:
+        """Test the column version agrees with _create_hyperlink."""
+        urls = pd.Series(["https://example.com/a", "https://example.com/b"])
+        texts = pd.Series(["Example", 'Show "Title"'])
+        result = converter._create_hyperlinks(urls, texts)
+        assert result.tolist() == [
+            converter._create_hyperlink(url, text)
+            for url, text in zip(urls, texts, strict=True)
+        ]
+
     def test_clean_data(
         self, converter: FringeConverter, sample_df: pd.DataFrame
     ) -> None:
@@ -74,6 +122,18 @@ class TestFringeConverter:
 
         assert pd.api.types.is_datetime64_any_dtype(result["date_normalized"])
 
+    def test_inputs_not_modified(
+        self, converter: FringeConverter, sample_df: pd.DataFrame
+    ) -> None:
+        """Test cleaning and reshaping leave their input frames untouched."""
+        original = sample_df.copy()
+        cleaned = converter.clean_data(sample_df)
+        cleaned_before = cleaned.copy()
+        converter.create_wide_format(cleaned)
+
+        pd.testing.assert_frame_equal(sample_df, original)
+        pd.testing.assert_frame_equal(cleaned, cleaned_before)
+
     def test_clean_data_drops_invalid_dates(self, converter: FringeConverter) -> None:
         """Test that invalid dates are dropped."""
         df = pd.DataFrame(
@@ -105,6 +165,22 @@ class TestFringeConverter:
         show_one = summary[summary["show-name"] == "Show One"].iloc[0]
         assert show_one["num_performances"] == 2
 
+    def test_create_summary_without_performer(
+        self, converter: FringeConverter, sample_df: pd.DataFrame
+    ) -> None:
+        """Test a missing performer column is reported as N/A."""
+        cleaned = converter.clean_data(sample_df.drop(columns=["show-performer"]))
+        summary = converter.create_summary(cleaned)
+
+        assert list(summary.columns) == [
+            "show-name",
+            "num_performances",
+            "first_date",
+            "last_date",
+            "performer",
+        ]
+        assert summary["performer"].tolist() == ["N/A", "N/A"]
+
     def test_create_wide_format(
         self, converter: FringeConverter, sample_df: pd.DataFrame
     ) -> None:
@@ -173,6 +249,24 @@ class TestSaveAllFormats:
             assert "cleaned" not in results
             assert results["summary"].exists()
 
+    def test_pyarrow_csv_engine(self, sample_df: pd.DataFrame) -> None:
+        """Test the pyarrow writer produces the same data as pandas."""
+        with TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            pandas_results = save_all_formats(
+                sample_df, output_dir / "pandas", "test-file"
+            )
+            arrow_results = save_all_formats(
+                sample_df, output_dir / "arrow", "test-file", csv_engine="pyarrow"
+            )
+
+            for fmt, path in pandas_results.items():
+                pd.testing.assert_frame_equal(
+                    pd.read_csv(arrow_results[fmt]),
+                    pd.read_csv(path),
+                    check_dtype=False,
+                )
+
 
 class TestFestivalPlannerExport:
     """Test Festival Planner format export."""
@@ -249,6 +343,53 @@ class TestFestivalPlannerExport:
         assert converter._parse_time_range("19:30") == ("19:30", "")
         assert converter._parse_time_range("") == ("", "")
 
+    def test_column_helpers_match_scalar(self, converter: FringeConverter) -> None:
+        """Test vectorized time and availability parsing agree with scalars."""
+        times = pd.Series(["19:30 - 20:30", "14:00 – 15:30", "19:30", "", None])
+        starts, ends = converter._parse_time_ranges(times)
+        assert list(zip(starts, ends, strict=True)) == [
+            converter._parse_time_range(t) for t in times
+        ]
+
+        raw = pd.Series(["SOLD_OUT", "two_for_one", "UNKNOWN", "", None])
+        assert converter._map_availabilities(raw).tolist() == [
+            converter._map_availability(a) for a in raw
+        ]
+
+    def test_export_drops_bad_dates(
+        self, converter: FringeConverter, sample_scraped_df: pd.DataFrame
+    ) -> None:
+        """Test rows with unparseable dates are left out of the export."""
+        df = sample_scraped_df.assign(date=["not a date", "Friday 07 August"])
+        result = converter.to_festival_planner_format(df)
+        assert result["show_name"].tolist() == ["Drama Play"]
+        assert result["date"].tolist() == ["2026-08-07"]
+
+    def test_export_missing_columns(self, converter: FringeConverter) -> None:
+        """Test optional scraped columns default to empty values."""
+        df = pd.DataFrame({"show-name": ["Solo"], "date": ["Friday 07 August"]})
+        result = converter.to_festival_planner_format(df, smart_parsing=False)
+        row = result.iloc[0]
+        assert row["venue_name"] == ""
+        assert row["start_time"] == ""
+        assert row["availability"] == "tickets-available"
+
+    @pytest.mark.parametrize("pattern", COMPANY_PATTERNS)
+    def test_each_company_pattern_detected(
+        self, converter: FringeConverter, pattern: str
+    ) -> None:
+        """Test every listed company pattern is matched, in any case."""
+        assert converter._is_production_company(f"Someone{pattern.upper()}")
+        assert converter._is_production_company(f"Someone{pattern}")
+
+    @pytest.mark.parametrize("pattern", SUBTITLE_PATTERNS)
+    def test_each_subtitle_pattern_rejected(
+        self, converter: FringeConverter, pattern: str
+    ) -> None:
+        """Test titles starting with, or equal to, a subtitle word are rejected."""
+        assert not converter._looks_like_performer_name(f"{pattern.title()}One")
+        assert not converter._looks_like_performer_name(pattern.strip().title())
+
     def test_is_production_company(self, converter: FringeConverter) -> None:
         """Test production company detection."""
         # Should be detected as production companies
@@ -400,6 +541,25 @@ class TestFestivalPlannerExport:
         assert producer == "Absolute Comedy"
         assert show == "Best of the Fest"
 
+    def test_export_parses_each_show_once(self, converter: FringeConverter) -> None:
+        """Test repeated performer/title pairs are parsed once each."""
+        df = pd.DataFrame(
+            {
+                "show-name": ["Mark Watson: Big Show"] * 3 + ["Other Show"],
+                "show-performer": ["Impatient Productions"] * 3 + ["Someone"],
+                "date": ["Thursday 06 August"] * 4,
+            }
+        )
+        with patch.object(
+            converter,
+            "_parse_performer_producer_show",
+            wraps=converter._parse_performer_producer_show,
+        ) as mock_parse:
+            result = converter.to_festival_planner_format(df, smart_parsing=True)
+
+        assert mock_parse.call_count == 2
+        assert result["performer"].tolist() == ["Mark Watson"] * 3 + ["Someone"]
+
     def test_variety_show_in_export(self, converter: FringeConverter) -> None:
         """Test that variety shows get 'Various' in exported data."""
         df = pd.DataFrame(
@@ -1,23 +1,175 @@
 """Tests for core business logic."""
 
+import threading
+from collections.abc import Iterator
+from datetime import date, time
 from pathlib import Path
+from time import sleep
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
+from edfringe_scrape.config import Settings
 from edfringe_scrape.core import (
+    PERFORMANCE_CATEGORY_COLUMNS,
     PERFORMANCE_COLUMNS,
     SHOW_INFO_COLUMNS,
+    FringeScraper,
     collect_venues,
     load_canonical,
     load_venue_cache,
     merge_performances,
     merge_show_info,
+    performance_columns,
     save_canonical,
+    save_raw_csv,
     save_venue_cache,
+    search_url,
     show_info_to_dataframe,
+    shows_to_dataframe,
 )
-from edfringe_scrape.models import ScrapedShow, ShowInfo, VenueInfo
+from edfringe_scrape.models import (
+    Genre,
+    PerformanceDetail,
+    ScrapedShow,
+    ShowCard,
+    ShowInfo,
+    VenueInfo,
+)
+from edfringe_scrape.scraper import ScrapingDogError
+
+
+class TestSearchUrl:
+    """Test search_url construction."""
+
+    def test_first_page(self) -> None:
+        """Test first page URL has no page parameter."""
+        url = search_url("https://www.edfringe.com", Genre.COMEDY)
+        assert url == (
+            "https://www.edfringe.com/tickets/whats-on?search=true&genres=COMEDY"
+        )
+
+    def test_filters_and_page(self) -> None:
+        """Test recently-added filter and page number are appended."""
+        url = search_url(
+            "https://www.edfringe.com", Genre.MUSIC, "LAST_SEVEN_DAYS", page=3
+        )
+        assert url.endswith(
+            "?search=true&genres=MUSIC&recentlyAdded=LAST_SEVEN_DAYS&page=3"
+        )
+
+
+class TestShowsToDataframe:
+    """Test shows_to_dataframe conversion."""
+
+    def test_genre_column(self) -> None:
+        """Test genre is added as the last column on every row."""
+        shows = [
+            ScrapedShow(
+                title="Show A",
+                url="https://edfringe.com/a",
+                performances=[
+                    PerformanceDetail(date=date(2026, 8, 1)),
+                    PerformanceDetail(date=date(2026, 8, 2)),
+                ],
+            ),
+            ScrapedShow(title="Show B", url="https://edfringe.com/b"),
+        ]
+        df = shows_to_dataframe(shows, genre="COMEDY")
+        assert list(df["genre"]) == ["COMEDY"] * 3
+        assert df.columns[-1] == "genre"
+        assert list(df["date"]) == ["Saturday 01 August", "Sunday 02 August", ""]
+
+    def test_performance_time_formats(self) -> None:
+        """Test start/end times are formatted as a range when both are set."""
+        day = date(2026, 8, 1)
+        shows = [
+            ScrapedShow(
+                title="Show A",
+                url="https://edfringe.com/a",
+                performances=[
+                    PerformanceDetail(
+                        date=day, start_time=time(19, 30), end_time=time(20, 45)
+                    ),
+                    PerformanceDetail(date=day, start_time=time(9, 5)),
+                    PerformanceDetail(date=day, end_time=time(20, 45)),
+                ],
+            )
+        ]
+        df = shows_to_dataframe(shows)
+        assert list(df["performance-time"]) == ["19:30 - 20:45", "09:05", ""]
+
+    def test_no_genre_column_by_default(self) -> None:
+        """Test genre column is omitted when no genre is given."""
+        shows = [ScrapedShow(title="Show A", url="https://edfringe.com/a")]
+        assert "genre" not in shows_to_dataframe(shows).columns
+
+    def test_accepts_generator(self) -> None:
+        """Test shows can be streamed from a generator."""
+        shows = [
+            ScrapedShow(title=f"Show {i}", url=f"https://edfringe.com/{i}")
+            for i in range(3)
+        ]
+        from_list = shows_to_dataframe(shows)
+        from_generator = shows_to_dataframe(show for show in shows)
+        pd.testing.assert_frame_equal(from_generator, from_list)
+
+    def test_no_shows_keeps_columns(self) -> None:
+        """Test an empty scrape still produces the expected header."""
+        df = shows_to_dataframe(iter([]), genre="COMEDY")
+        assert df.empty
+        assert list(df.columns) == PERFORMANCE_COLUMNS
+
+    def test_appended_columns_match_concat(self) -> None:
+        """Test one build over appended genres equals per-genre concat."""
+        comedy = [ScrapedShow(title="Show A", url="https://edfringe.com/a")]
+        music = [
+            ScrapedShow(
+                title="Show B",
+                url="https://edfringe.com/b",
+                performer="Band B",
+                performances=[
+                    PerformanceDetail(date=date(2026, 8, 1), venue="Venue 1"),
+                    PerformanceDetail(date=date(2026, 8, 2), availability="SOLD_OUT"),
+                ],
+            )
+        ]
+        batches = [("COMEDY", comedy), ("MUSIC", music)]
+
+        columns: dict[str, list[str]] = {}
+        for genre, shows in batches:
+            performance_columns(shows, genre=genre, into=columns)
+        combined = pd.DataFrame(columns)
+
+        concatenated = pd.concat(
+            [shows_to_dataframe(shows, genre=genre) for genre, shows in batches],
+            ignore_index=True,
+        )
+        pd.testing.assert_frame_equal(combined, concatenated)
+        assert list(combined.columns) == PERFORMANCE_COLUMNS
+        assert list(combined["show-performer"]) == ["", "Band B", "Band B"]
+
+
+class TestSaveRawCsv:
+    """Test saving raw scraped data."""
+
+    @pytest.mark.parametrize("csv_engine", ["pandas", "pyarrow"])
+    def test_round_trip(self, tmp_path: Path, csv_engine: str) -> None:
+        """Test either CSV writer produces the same data and a sidecar."""
+        shows = [
+            ScrapedShow(
+                title='Show "A", live',
+                url="https://edfringe.com/a",
+                performances=[PerformanceDetail(date=date(2026, 8, 1))],
+            )
+        ]
+        df = shows_to_dataframe(shows, genre="COMEDY")
+        path = save_raw_csv(df, tmp_path, "COMEDY", csv_engine=csv_engine)
+        assert path.name.endswith("-EdFringe-COMEDY.csv")
+        assert path.with_suffix(".parquet").exists()
+        loaded = pd.read_csv(path, dtype=str, keep_default_na=False)
+        pd.testing.assert_frame_equal(loaded, df, check_dtype=False)
 
 
 class TestShowInfoToDataframe:
@@ -282,6 +434,25 @@ class TestMergePerformances:
         assert len(result) == 1
         assert result.iloc[0]["show-link-href"] == "/c"
 
+    def test_categorical_new_data(self) -> None:
+        """Categorical columns in new data merge like plain strings."""
+        existing = _make_perf_df([
+            {"show-link-href": "/a", "date": "Mon 1 Aug", "performance-time": "14:00",
+             "show-availability": "AVAILABLE", "genre": "MUSIC"},
+        ])
+        new = _make_perf_df([
+            {"show-link-href": "/b", "date": "Tue 2 Aug", "performance-time": "15:00",
+             "show-availability": "SOLD_OUT", "genre": "COMEDY"},
+        ])
+        categorical = new.astype({c: "category" for c in PERFORMANCE_CATEGORY_COLUMNS})
+        for full_mode in (False, True):
+            expected = merge_performances(existing, new, full_mode=full_mode)
+            result = merge_performances(existing, categorical, full_mode=full_mode)
+            assert list(result["genre"]) == list(expected["genre"])
+            assert list(result["show-availability"]) == list(
+                expected["show-availability"]
+            )
+
     def test_full_mode_preserves_other_genres(self) -> None:
         """Full mode only replaces the scraped genre, not others."""
         existing = _make_perf_df([
@@ -377,6 +548,49 @@ class TestLoadCanonical:
         assert result.empty
         assert list(result.columns) == ["col_a", "col_b"]
 
+    def test_exclude_genres(self, tmp_path: Path) -> None:
+        """Test rows for excluded genres are dropped across chunks."""
+        csv_path = tmp_path / "test.csv"
+        df = pd.DataFrame(
+            {
+                "show-link-href": [f"/{i}" for i in range(6)],
+                "genre": ["COMEDY", "MUSIC", "THEATRE"] * 2,
+            }
+        )
+        df.to_csv(csv_path, index=False)
+
+        with patch("edfringe_scrape.core._CANONICAL_CHUNK_ROWS", 2):
+            result = load_canonical(
+                csv_path,
+                ["show-link-href", "genre"],
+                exclude_genres={"COMEDY", "THEATRE"},
+            )
+
+        assert list(result["genre"]) == ["MUSIC", "MUSIC"]
+        assert list(result.index) == [0, 1]
+
+    def test_reads_sidecar_written_by_save(self, tmp_path: Path) -> None:
+        """Test save/load round-trips through the Parquet sidecar."""
+        csv_path = tmp_path / "performances.csv"
+        df = pd.DataFrame(
+            {
+                "show-link-href": ["/a", "/b", "/c"],
+                "show-performer": ["", "P", "Q"],
+                "genre": ["COMEDY", "MUSIC", "COMEDY"],
+            }
+        )
+        save_canonical(df, csv_path)
+        assert (tmp_path / "performances.parquet").exists()
+
+        with patch("edfringe_scrape.core.pd.read_csv") as mock_read_csv:
+            result = load_canonical(
+                csv_path, list(df.columns), exclude_genres={"COMEDY"}
+            )
+
+        mock_read_csv.assert_not_called()
+        assert list(result["show-link-href"]) == ["/b"]
+        assert pd.isna(load_canonical(csv_path, list(df.columns)).iloc[0, 1])
+
 
 class TestSaveCanonical:
     """Test save_canonical function."""
@@ -396,3 +610,208 @@ class TestSaveCanonical:
         df = pd.DataFrame({"a": [1]})
         save_canonical(df, csv_path)
         assert csv_path.exists()
+
+
+class TestFetchAllSearchResults:
+    """Test paging through search results."""
+
+    def test_duplicate_cards_yielded_once(self, test_settings: Settings) -> None:
+        """Test shows repeated within and across pages are yielded once."""
+        scraper = FringeScraper(test_settings)
+        pages = {
+            1: [
+                ShowCard(title="Show 0", url="https://edfringe.com/shows/0"),
+                ShowCard(title="Show 0", url="https://edfringe.com/shows/0"),
+                ShowCard(title="Show 1", url="https://edfringe.com/shows/1"),
+            ],
+            2: [
+                ShowCard(title="Show 1", url="https://edfringe.com/shows/1"),
+                ShowCard(title="Show 2", url="https://edfringe.com/shows/2"),
+            ],
+            3: [ShowCard(title="Show 2", url="https://edfringe.com/shows/2")],
+        }
+
+        with patch.object(
+            scraper,
+            "_fetch_search_page",
+            side_effect=lambda genre, page, recently_added: pages.get(page, []),
+        ) as mock_page:
+            cards = list(scraper.fetch_all_search_results(Genre.COMEDY))
+
+        assert [c.title for c in cards] == ["Show 0", "Show 1", "Show 2"]
+        assert mock_page.call_count == 3
+
+    def test_max_shows(self, test_settings: Settings) -> None:
+        """Test listing stops once max_shows cards have been yielded."""
+        scraper = FringeScraper(test_settings)
+        page = [
+            ShowCard(title=f"Show {i}", url=f"https://edfringe.com/shows/{i}")
+            for i in range(5)
+        ]
+
+        with patch.object(scraper, "_fetch_search_page", return_value=page):
+            cards = list(scraper.fetch_all_search_results(Genre.COMEDY, max_shows=3))
+
+        assert [c.title for c in cards] == ["Show 0", "Show 1", "Show 2"]
+
+
+class TestFetchShowsWithDetails:
+    """Test concurrent detail fetching."""
+
+    def test_yields_every_card_with_index(self, test_settings: Settings) -> None:
+        """Test each card is fetched once and tagged with its index."""
+        scraper = FringeScraper(test_settings)
+        cards = [
+            ShowCard(title=f"Show {i}", url=f"https://edfringe.com/shows/{i}")
+            for i in range(10)
+        ]
+
+        def fake_fetch(card: ShowCard, genre: Genre) -> ScrapedShow:
+            return ScrapedShow(title=card.title, url=card.url, genre=genre)
+
+        with patch.object(scraper, "_fetch_show_details", side_effect=fake_fetch):
+            results = list(
+                scraper.fetch_shows_with_details(cards, Genre.COMEDY, max_workers=4)
+            )
+
+        assert len(results) == 10
+        by_index = dict(results)
+        for idx, card in enumerate(cards):
+            assert by_index[idx].url == card.url
+            assert by_index[idx].genre == Genre.COMEDY
+
+    def test_empty_cards(self, test_settings: Settings) -> None:
+        """Test no cards yields nothing."""
+        scraper = FringeScraper(test_settings)
+        assert list(scraper.fetch_shows_with_details([], Genre.COMEDY)) == []
+
+    def test_lazy_cards_fetched_while_listing(self, test_settings: Settings) -> None:
+        """Test details start before the card iterator is exhausted."""
+        scraper = FringeScraper(test_settings)
+        first_fetched = threading.Event()
+
+        def fake_fetch(card: ShowCard, genre: Genre) -> ScrapedShow:
+            first_fetched.set()
+            return ScrapedShow(title=card.title, url=card.url, genre=genre)
+
+        def cards() -> Iterator[ShowCard]:
+            yield ShowCard(title="Show 0", url="https://edfringe.com/shows/0")
+            # A second search page is only requested after the first
+            # card's details are already underway
+            assert first_fetched.wait(timeout=5)
+            yield ShowCard(title="Show 1", url="https://edfringe.com/shows/1")
+
+        with patch.object(scraper, "_fetch_show_details", side_effect=fake_fetch):
+            results = dict(
+                scraper.fetch_shows_with_details(cards(), Genre.COMEDY, max_workers=2)
+            )
+
+        assert [results[i].title for i in range(2)] == ["Show 0", "Show 1"]
+
+    def test_results_yielded_while_listing(self, test_settings: Settings) -> None:
+        """Test finished fetches are yielded before the card iterator ends."""
+        scraper = FringeScraper(test_settings)
+        first_fetched = threading.Event()
+        listing_done = False
+
+        def fake_fetch(card: ShowCard, genre: Genre) -> ScrapedShow:
+            first_fetched.set()
+            return ScrapedShow(title=card.title, url=card.url, genre=genre)
+
+        def cards() -> Iterator[ShowCard]:
+            nonlocal listing_done
+            yield ShowCard(title="Show 0", url="https://edfringe.com/shows/0")
+            # Let the first fetch finish before the next page is listed
+            assert first_fetched.wait(timeout=5)
+            sleep(0.1)
+            yield ShowCard(title="Show 1", url="https://edfringe.com/shows/1")
+            listing_done = True
+
+        with patch.object(scraper, "_fetch_show_details", side_effect=fake_fetch):
+            results = scraper.fetch_shows_with_details(
+                cards(), Genre.COMEDY, max_workers=2
+            )
+            idx, show = next(results)
+            assert not listing_done
+            assert (idx, show.title) == (0, "Show 0")
+            assert [i for i, _ in results] == [1]
+
+    def test_listing_error_propagates(self, test_settings: Settings) -> None:
+        """Test an error while listing cards is raised to the caller."""
+        scraper = FringeScraper(test_settings)
+
+        def cards() -> Iterator[ShowCard]:
+            yield ShowCard(title="Show 0", url="https://edfringe.com/shows/0")
+            raise ScrapingDogError("search page failed")
+
+        with (
+            patch.object(
+                scraper,
+                "_fetch_show_details",
+                side_effect=lambda card, genre: ScrapedShow(
+                    title=card.title, url=card.url
+                ),
+            ),
+            pytest.raises(ScrapingDogError),
+        ):
+            list(scraper.fetch_shows_with_details(cards(), Genre.COMEDY))
+
+
+class TestFetchVenueContacts:
+    """Test concurrent venue contact fetching."""
+
+    def test_only_unknown_venues_fetched(self, test_settings: Settings) -> None:
+        """Test cached venues are skipped and new ones get contacts."""
+        scraper = FringeScraper(test_settings)
+        venues = {
+            f"V{i}": VenueInfo(
+                venue_code=f"V{i}",
+                venue_name=f"Venue {i}",
+                venue_page_url=f"https://edfringe.com/venues/{i}",
+            )
+            for i in range(6)
+        }
+
+        def fake_fetch(venue: VenueInfo) -> VenueInfo:
+            return venue.model_copy(update={"contact_phone": "0131"})
+
+        with patch.object(
+            scraper, "_fetch_venue_contact", side_effect=fake_fetch
+        ) as mock_fetch:
+            result = scraper.fetch_venue_contacts(
+                venues, known_codes={"V0", "V1"}, max_workers=3
+            )
+
+        assert mock_fetch.call_count == 4
+        assert result["V0"].contact_phone == ""
+        assert all(result[f"V{i}"].contact_phone == "0131" for i in range(2, 6))
+
+    def test_venue_without_page_unchanged(self, test_settings: Settings) -> None:
+        """Test a venue with no page URL is returned as-is."""
+        scraper = FringeScraper(test_settings)
+        venue = VenueInfo(venue_code="V1", venue_name="Venue")
+        assert scraper._fetch_venue_contact(venue) is venue
+
+    def test_shared_venue_page_fetched_once(self, test_settings: Settings) -> None:
+        """Test venues sharing a page URL trigger a single fetch."""
+        scraper = FringeScraper(test_settings)
+        venues = [
+            VenueInfo(
+                venue_code=code,
+                venue_name=f"Venue {code}",
+                venue_page_url="https://edfringe.com/venues/hub",
+            )
+            for code in ("V1", "V2", "V3")
+        ]
+
+        def fake_fetch(venue: VenueInfo) -> VenueInfo:
+            return venue.model_copy(update={"contact_email": "box@hub.example"})
+
+        with patch.object(
+            scraper, "_fetch_venue_contact", side_effect=fake_fetch
+        ) as mock_fetch:
+            results = list(scraper.iter_venue_contacts(venues, max_workers=2))
+
+        assert mock_fetch.call_count == 1
+        assert sorted(v.venue_code for v in results) == ["V1", "V2", "V3"]
+        assert all(v.contact_email == "box@hub.example" for v in results)
@@ -6,6 +6,8 @@ import pytest
 from pydantic import ValidationError
 
 from edfringe_scrape.models import (
+    GENRE_VALUES,
+    GENRES_BY_VALUE,
     Genre,
     Performance,
     PerformanceDetail,
@@ -32,6 +34,12 @@ class TestGenre:
         assert Genre.COMEDY.url_param == "COMEDY"
         assert Genre.CHILDRENS_SHOWS.url_param == "CHILDRENS_SHOWS"
 
+    def test_genre_lookups(self) -> None:
+        """Test precomputed genre value tuple and lookup dict."""
+        assert tuple(g.value for g in Genre) == GENRE_VALUES
+        assert GENRES_BY_VALUE["COMEDY"] is Genre.COMEDY
+        assert "NOT_A_GENRE" not in GENRES_BY_VALUE
+
 
 class TestShow:
     """Test Show model validation."""
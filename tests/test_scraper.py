@@ -1,5 +1,6 @@
 """Tests for Scraping Dog client and API discovery."""
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import httpx
@@ -169,12 +170,7 @@ class TestFetchPageRetry:
         """Test successful request does not retry."""
         mock_client = MagicMock()
         mock_client.get.return_value = _mock_response()
-        mock_client_cls.return_value.__enter__ = MagicMock(
-            return_value=mock_client
-        )
-        mock_client_cls.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
+        mock_client_cls.return_value = mock_client
 
         client = _make_client()
         result = client.fetch_page("https://example.com")
@@ -192,12 +188,7 @@ class TestFetchPageRetry:
             _mock_response(status_code=502, text="Bad Gateway"),
             _mock_response(status_code=200, text="<html>ok</html>"),
         ]
-        mock_client_cls.return_value.__enter__ = MagicMock(
-            return_value=mock_client
-        )
-        mock_client_cls.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
+        mock_client_cls.return_value = mock_client
 
         client = _make_client()
         result = client.fetch_page("https://example.com")
@@ -215,12 +206,7 @@ class TestFetchPageRetry:
         mock_client.get.return_value = _mock_response(
             status_code=500, text="Server Error"
         )
-        mock_client_cls.return_value.__enter__ = MagicMock(
-            return_value=mock_client
-        )
-        mock_client_cls.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
+        mock_client_cls.return_value = mock_client
 
         client = _make_client(max_retries=2)
         with pytest.raises(ScrapingDogError, match="status 500"):
@@ -237,12 +223,7 @@ class TestFetchPageRetry:
         mock_client.get.return_value = _mock_response(
             status_code=404, text="Not Found"
         )
-        mock_client_cls.return_value.__enter__ = MagicMock(
-            return_value=mock_client
-        )
-        mock_client_cls.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
+        mock_client_cls.return_value = mock_client
 
         client = _make_client()
         with pytest.raises(ScrapingDogError, match="status 404"):
@@ -258,12 +239,7 @@ class TestFetchPageRetry:
             _mock_response(status_code=429, text="Rate limited"),
             _mock_response(status_code=200, text="<html>ok</html>"),
         ]
-        mock_client_cls.return_value.__enter__ = MagicMock(
-            return_value=mock_client
-        )
-        mock_client_cls.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
+        mock_client_cls.return_value = mock_client
 
         client = _make_client()
         result = client.fetch_page("https://example.com")
@@ -286,12 +262,7 @@ class TestFetchPageRetry:
             _mock_response(status_code=200, text=cloudflare_html),
             _mock_response(status_code=200, text="<html>ok</html>"),
         ]
-        mock_client_cls.return_value.__enter__ = MagicMock(
-            return_value=mock_client
-        )
-        mock_client_cls.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
+        mock_client_cls.return_value = mock_client
 
         client = _make_client()
         result = client.fetch_page("https://example.com")
@@ -314,12 +285,7 @@ class TestFetchPageRetry:
         mock_client.get.return_value = _mock_response(
             status_code=200, text=cloudflare_html
         )
-        mock_client_cls.return_value.__enter__ = MagicMock(
-            return_value=mock_client
-        )
-        mock_client_cls.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
+        mock_client_cls.return_value = mock_client
 
         client = _make_client(max_retries=2)
         with pytest.raises(ScrapingDogError, match="Cloudflare 502"):
@@ -337,12 +303,7 @@ class TestFetchPageRetry:
         mock_client.get.return_value = _mock_response(
             status_code=404, text=long_html
         )
-        mock_client_cls.return_value.__enter__ = MagicMock(
-            return_value=mock_client
-        )
-        mock_client_cls.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
+        mock_client_cls.return_value = mock_client
 
         client = _make_client()
         with pytest.raises(ScrapingDogError) as exc_info:
@@ -359,12 +320,7 @@ class TestFetchPageRetry:
         mock_client.get.return_value = _mock_response(
             status_code=500, text="Server Error"
         )
-        mock_client_cls.return_value.__enter__ = MagicMock(
-            return_value=mock_client
-        )
-        mock_client_cls.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
+        mock_client_cls.return_value = mock_client
 
         client = _make_client(max_retries=2)
         with pytest.raises(ScrapingDogError):
@@ -376,3 +332,108 @@ class TestFetchPageRetry:
         assert len(warning_logs) == 1
         assert "data may be lost" in warning_logs[0].message
         assert "example.com/test-page" in warning_logs[0].message
+
+
+class TestRateLimit:
+    """Test spacing between request start times."""
+
+    @patch("edfringe_scrape.scraper.time.sleep")
+    def test_delay_includes_jitter(self, mock_sleep: MagicMock) -> None:
+        """Test the jitter is added on top of the fixed delay."""
+        settings = Settings(
+            scrapingdog_api_key="test_key",
+            request_delay_ms=1000,
+            request_jitter_ms=500,
+        )
+        client = ScrapingDogClient(settings)
+        with patch("edfringe_scrape.scraper.random.uniform", return_value=250.0):
+            client._rate_limit()
+            client._rate_limit()
+
+        mock_sleep.assert_called_once()
+        assert 1.2 < mock_sleep.call_args.args[0] <= 1.25
+
+    @patch("edfringe_scrape.scraper.time.sleep")
+    def test_no_jitter_by_default(self, mock_sleep: MagicMock) -> None:
+        """Test no random delay is drawn when jitter is disabled."""
+        settings = Settings(scrapingdog_api_key="test_key", request_delay_ms=1000)
+        client = ScrapingDogClient(settings)
+        with patch("edfringe_scrape.scraper.random.uniform") as mock_uniform:
+            client._rate_limit()
+            client._rate_limit()
+
+        mock_uniform.assert_not_called()
+        assert mock_sleep.call_args.args[0] <= 1.0
+
+
+class TestConnectionReuse:
+    """Test the pooled HTTP client is shared across requests."""
+
+    @patch("edfringe_scrape.scraper.httpx.Client")
+    def test_one_http_client_for_many_requests(
+        self, mock_client_cls: MagicMock
+    ) -> None:
+        """Test repeated fetches reuse the client created at init."""
+        mock_client = MagicMock()
+        mock_client.get.return_value = _mock_response()
+        mock_client_cls.return_value = mock_client
+
+        client = _make_client()
+        for _ in range(3):
+            client.fetch_page("https://example.com")
+
+        assert mock_client_cls.call_count == 1
+        assert mock_client.get.call_count == 3
+
+    @patch("edfringe_scrape.scraper.httpx.Client")
+    def test_context_manager_closes_client(
+        self, mock_client_cls: MagicMock
+    ) -> None:
+        """Test leaving the context closes pooled connections."""
+        mock_client = MagicMock()
+        mock_client_cls.return_value = mock_client
+
+        with _make_client():
+            pass
+
+        mock_client.close.assert_called_once()
+
+
+class TestResponseCaching:
+    """Test the optional on-disk response cache in fetch_page."""
+
+    @patch("edfringe_scrape.scraper.httpx.Client")
+    def test_cached_page_skips_request(
+        self, mock_client_cls: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a second fetch of the same URL is served from the cache."""
+        mock_client = MagicMock()
+        mock_client.get.return_value = _mock_response(text="<html>ok</html>")
+        mock_client_cls.return_value = mock_client
+
+        settings = Settings(
+            scrapingdog_api_key="test_key",
+            request_delay_ms=0,
+            response_cache_ttl_hours=1,
+            cache_dir=str(tmp_path),
+        )
+        with ScrapingDogClient(settings) as client:
+            first = client.fetch_page("https://example.com")
+            second = client.fetch_page("https://example.com")
+
+        assert mock_client.get.call_count == 1
+        assert second.html == first.html == "<html>ok</html>"
+        assert second.credits_used == 0
+
+    @patch("edfringe_scrape.scraper.httpx.Client")
+    def test_cache_disabled_by_default(self, mock_client_cls: MagicMock) -> None:
+        """Test every fetch hits the API when no TTL is configured."""
+        mock_client = MagicMock()
+        mock_client.get.return_value = _mock_response()
+        mock_client_cls.return_value = mock_client
+
+        client = _make_client()
+        client.fetch_page("https://example.com")
+        client.fetch_page("https://example.com")
+
+        assert mock_client.get.call_count == 2
@@ -1,14 +1,22 @@
 """Tests for snapshot comparison."""
 
+from pathlib import Path
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 
 from edfringe_scrape.snapshot import (
     SnapshotDiff,
     compare_snapshots,
+    compare_with_snapshot_file,
+    find_latest_snapshot,
     format_diff_as_html,
     format_diff_as_text,
+    load_snapshot,
+    write_snapshot_digest,
 )
+from edfringe_scrape.storage import write_csv_with_sidecar
 
 
 @pytest.fixture
@@ -248,3 +256,130 @@ class TestFormatDiff:
         assert "<html>" in html
         assert "Brand New Show" in html
         assert "NEW" in html
+
+
+class TestLoadSnapshot:
+    """Test loading snapshot files."""
+
+    def test_csv_loaded_as_strings(
+        self, tmp_path: Path, base_snapshot: pd.DataFrame
+    ) -> None:
+        """Test CSV snapshots are read without dtype inference."""
+        path = tmp_path / "2026-02-10-full-snapshot.csv"
+        base_snapshot.to_csv(path, index=False)
+        df = load_snapshot(path)
+        assert len(df) == len(base_snapshot)
+        assert all(pd.api.types.is_string_dtype(df[c]) for c in df.columns)
+
+    def test_prefers_sidecar(
+        self, tmp_path: Path, base_snapshot: pd.DataFrame
+    ) -> None:
+        """Test a fresh Parquet sidecar is read instead of the CSV."""
+        path = tmp_path / "2026-02-10-full-snapshot.csv"
+        write_csv_with_sidecar(base_snapshot, path)
+        with patch("edfringe_scrape.snapshot.pd.read_csv") as mock_read_csv:
+            df = load_snapshot(path)
+        mock_read_csv.assert_not_called()
+        pd.testing.assert_frame_equal(df, base_snapshot, check_dtype=False)
+
+    def test_parquet_snapshot(
+        self, tmp_path: Path, base_snapshot: pd.DataFrame
+    ) -> None:
+        """Test a Parquet snapshot is loaded directly."""
+        path = tmp_path / "2026-02-10-full-snapshot.parquet"
+        base_snapshot.to_parquet(path, index=False)
+        df = load_snapshot(path)
+        pd.testing.assert_frame_equal(df, base_snapshot, check_dtype=False)
+
+
+class TestFindLatestSnapshot:
+    """Test locating the most recent snapshot."""
+
+    def test_csv_preferred_over_its_sidecar(
+        self, tmp_path: Path, base_snapshot: pd.DataFrame
+    ) -> None:
+        """Test a CSV is returned rather than its Parquet sidecar."""
+        write_csv_with_sidecar(base_snapshot, tmp_path / "2026-02-10-full-snapshot.csv")
+        latest = find_latest_snapshot(tmp_path)
+        assert latest == tmp_path / "2026-02-10-full-snapshot.csv"
+
+    def test_parquet_only_snapshot(
+        self, tmp_path: Path, base_snapshot: pd.DataFrame
+    ) -> None:
+        """Test a newer Parquet snapshot without a CSV is found."""
+        base_snapshot.to_csv(tmp_path / "2026-02-10-full-snapshot.csv", index=False)
+        base_snapshot.to_parquet(tmp_path / "2026-02-11-full-snapshot.parquet")
+        latest = find_latest_snapshot(tmp_path)
+        assert latest == tmp_path / "2026-02-11-full-snapshot.parquet"
+
+    def test_exclude_date(self, tmp_path: Path, base_snapshot: pd.DataFrame) -> None:
+        """Test snapshots for the excluded date are skipped."""
+        base_snapshot.to_csv(tmp_path / "2026-02-10-full-snapshot.csv", index=False)
+        base_snapshot.to_csv(tmp_path / "2026-02-11-recent-snapshot.csv", index=False)
+        latest = find_latest_snapshot(tmp_path, exclude_date="2026-02-11")
+        assert latest == tmp_path / "2026-02-10-full-snapshot.csv"
+
+
+class TestCompareWithSnapshotFile:
+    """Test comparing against a saved snapshot with a digest."""
+
+    def test_unchanged_skips_load(
+        self, tmp_path: Path, base_snapshot: pd.DataFrame
+    ) -> None:
+        """Test matching digests return an empty diff without loading."""
+        path = tmp_path / "2026-02-10-full-snapshot.csv"
+        base_snapshot.to_csv(path, index=False)
+        write_snapshot_digest(base_snapshot, path)
+        current = base_snapshot.assign(
+            **{"web-scraper-scrape-time": "2026-02-11T06:00:00"}
+        ).astype({"show-location": "category"})
+
+        with patch("edfringe_scrape.snapshot.load_snapshot") as mock_load:
+            diff = compare_with_snapshot_file(path, current)
+
+        mock_load.assert_not_called()
+        assert not diff.has_changes
+        assert diff.old_snapshot_date == "2026-02-10 06:00"
+        assert diff.new_snapshot_date == "2026-02-11 06:00"
+
+    def test_changed_runs_comparison(
+        self, tmp_path: Path, base_snapshot: pd.DataFrame
+    ) -> None:
+        """Test differing data falls through to a full comparison."""
+        path = tmp_path / "2026-02-10-full-snapshot.csv"
+        base_snapshot.to_csv(path, index=False)
+        write_snapshot_digest(base_snapshot, path)
+        current = base_snapshot.copy()
+        current.loc[0, "show-availability"] = "SOLD_OUT"
+
+        diff = compare_with_snapshot_file(path, current)
+
+        assert len(diff.sold_out_performances) == 1
+
+    def test_missing_digest_runs_comparison(
+        self, tmp_path: Path, base_snapshot: pd.DataFrame
+    ) -> None:
+        """Test snapshots saved without a digest are still compared."""
+        path = tmp_path / "2026-02-10-full-snapshot.csv"
+        base_snapshot.to_csv(path, index=False)
+
+        with patch(
+            "edfringe_scrape.snapshot.load_snapshot", wraps=load_snapshot
+        ) as mock_load:
+            diff = compare_with_snapshot_file(path, base_snapshot)
+
+        mock_load.assert_called_once_with(path)
+        assert not diff.has_changes
+
+    def test_unchanged_parquet_snapshot(
+        self, tmp_path: Path, base_snapshot: pd.DataFrame
+    ) -> None:
+        """Test the digest short-circuit works for Parquet snapshots."""
+        path = tmp_path / "2026-02-10-full-snapshot.parquet"
+        base_snapshot.to_parquet(path, index=False)
+        write_snapshot_digest(base_snapshot, path)
+
+        diff = compare_with_snapshot_file(path, base_snapshot)
+
+        assert not diff.has_changes
+        assert diff.old_snapshot_date == "2026-02-10 06:00"
@@ -0,0 +1,201 @@
+"""Tests for tabular file storage."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from edfringe_scrape.storage import (
+    OUTPUT_FORMATS,
+    ensure_dir,
+    format_for_path,
+    frame_digest,
+    read_frame,
+    sidecar_path,
+    write_csv_with_sidecar,
+    write_frame,
+)
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Create a small performance-like DataFrame."""
+    return pd.DataFrame(
+        {
+            "show-link-href": ["https://edfringe.com/a", "https://edfringe.com/b"],
+            "show-name": ["Show A", 'Show "B", live'],
+            "date": ["Wednesday 30 July", "Thursday 31 July"],
+            "genre": ["COMEDY", "COMEDY"],
+        }
+    )
+
+
+class TestFormatForPath:
+    """Test format inference from file extensions."""
+
+    @pytest.mark.parametrize("fmt", OUTPUT_FORMATS)
+    def test_known_extensions(self, fmt: str) -> None:
+        """Test each supported extension maps to its format."""
+        assert format_for_path(Path(f"data.{fmt}")) == fmt
+
+    def test_uppercase_extension(self) -> None:
+        """Test extension matching is case-insensitive."""
+        assert format_for_path(Path("data.PARQUET")) == "parquet"
+
+    def test_unknown_extension_is_csv(self) -> None:
+        """Test unknown extensions fall back to CSV."""
+        assert format_for_path(Path("data.txt")) == "csv"
+
+
+class TestRoundTrip:
+    """Test writing and reading back each format."""
+
+    @pytest.mark.parametrize("fmt", OUTPUT_FORMATS)
+    def test_round_trip(
+        self, tmp_path: Path, sample_df: pd.DataFrame, fmt: str
+    ) -> None:
+        """Test data survives a write/read cycle unchanged."""
+        path = tmp_path / f"data.{fmt}"
+        write_frame(sample_df, path)
+        loaded = read_frame(path)
+        pd.testing.assert_frame_equal(loaded, sample_df, check_dtype=False)
+
+    def test_pyarrow_csv_engine(self, tmp_path: Path, sample_df: pd.DataFrame) -> None:
+        """Test the pyarrow CSV writer produces readable, equivalent data."""
+        path = tmp_path / "data.csv"
+        write_frame(sample_df, path, csv_engine="pyarrow")
+        loaded = read_frame(path)
+        pd.testing.assert_frame_equal(loaded, sample_df, check_dtype=False)
+
+    def test_csv_uses_unix_line_endings(
+        self, tmp_path: Path, sample_df: pd.DataFrame
+    ) -> None:
+        """Test CSV rows end in a bare newline on every platform."""
+        path = write_frame(sample_df, tmp_path / "data.csv")
+        data = path.read_bytes()
+        assert b"\r\n" not in data
+        assert data.count(b"\n") == len(sample_df) + 1
+
+    def test_read_as_strings(self, tmp_path: Path) -> None:
+        """Test as_strings matches read_csv with dtype=str, values untouched."""
+        path = tmp_path / "data.csv"
+        path.write_text(
+            "web-scraper-scrape-time,performance-time,show-name,count\n"
+            '2026-02-10T06:00:00,19:30,"Show ""A"", live",1\n'
+            "2026-02-10T06:00:00,,NA,02\n"
+        )
+        loaded = read_frame(path, as_strings=True)
+        pd.testing.assert_frame_equal(loaded, pd.read_csv(path, dtype=str))
+        assert loaded.loc[0, "web-scraper-scrape-time"] == "2026-02-10T06:00:00"
+        assert loaded.loc[1, "count"] == "02"
+
+    def test_explicit_format_overrides_extension(
+        self, tmp_path: Path, sample_df: pd.DataFrame
+    ) -> None:
+        """Test fmt argument wins over the file extension."""
+        path = tmp_path / "data.csv"
+        write_frame(sample_df, path, fmt="parquet")
+        loaded = pd.read_parquet(path)
+        assert len(loaded) == 2
+
+
+class TestAtomicWrite:
+    """Test files are replaced atomically."""
+
+    def test_no_temp_file_left(self, tmp_path: Path, sample_df: pd.DataFrame) -> None:
+        """Test only the target file remains after a write."""
+        write_frame(sample_df, tmp_path / "data.csv")
+        assert [p.name for p in tmp_path.iterdir()] == ["data.csv"]
+
+    def test_failed_write_keeps_original(
+        self, tmp_path: Path, sample_df: pd.DataFrame
+    ) -> None:
+        """Test a write that fails midway leaves the old file untouched."""
+        path = write_frame(sample_df, tmp_path / "data.csv")
+        original = path.read_text()
+
+        def partial_write(df: pd.DataFrame, target: Path, *args: str) -> None:
+            target.write_text("show-link-href\nhttps://edf")
+            raise OSError("disk full")
+
+        with (
+            patch("edfringe_scrape.storage._write_frame_to", partial_write),
+            pytest.raises(OSError),
+        ):
+            write_frame(sample_df.head(1), path)
+
+        assert path.read_text() == original
+        assert [p.name for p in tmp_path.iterdir()] == ["data.csv"]
+
+
+class TestSidecar:
+    """Test Parquet sidecars written next to CSVs."""
+
+    @pytest.fixture
+    def sample_df(self, sample_df: pd.DataFrame) -> pd.DataFrame:
+        """Add a column with an empty value, as scraped data often has."""
+        return sample_df.assign(**{"show-performer": ["", "Someone"]})
+
+    def test_writes_both_files(self, tmp_path: Path, sample_df: pd.DataFrame) -> None:
+        """Test CSV and sidecar are both written."""
+        path = write_csv_with_sidecar(sample_df, tmp_path / "data.csv")
+        assert path.exists()
+        assert sidecar_path(path) == tmp_path / "data.parquet"
+        assert sidecar_path(path).exists()
+
+    def test_sidecar_matches_csv(self, tmp_path: Path, sample_df: pd.DataFrame) -> None:
+        """Test reading via the sidecar gives the same data as the CSV."""
+        path = write_csv_with_sidecar(sample_df, tmp_path / "data.csv")
+        from_csv = read_frame(path)
+        from_sidecar = read_frame(path, prefer_sidecar=True)
+        pd.testing.assert_frame_equal(from_sidecar, from_csv, check_dtype=False)
+
+    def test_stale_sidecar_ignored(
+        self, tmp_path: Path, sample_df: pd.DataFrame
+    ) -> None:
+        """Test a sidecar older than its CSV is not used."""
+        path = write_csv_with_sidecar(sample_df, tmp_path / "data.csv")
+        sample_df.head(1).to_csv(path, index=False)
+        stat = path.stat()
+        os.utime(sidecar_path(path), (stat.st_atime, stat.st_mtime - 10))
+        assert len(read_frame(path, prefer_sidecar=True)) == 1
+
+
+class TestFrameDigest:
+    """Test DataFrame content digests."""
+
+    def test_ignores_dtype(self, sample_df: pd.DataFrame) -> None:
+        """Test categorical columns hash the same as strings."""
+        as_category = sample_df.astype({"genre": "category"})
+        assert frame_digest(as_category) == frame_digest(sample_df)
+
+    def test_excluded_columns(self, sample_df: pd.DataFrame) -> None:
+        """Test excluded columns do not affect the digest."""
+        changed = sample_df.assign(genre="MUSIC")
+        assert frame_digest(changed) != frame_digest(sample_df)
+        assert frame_digest(changed, ["genre"]) == frame_digest(sample_df, ["genre"])
+
+    def test_column_names_matter(self, sample_df: pd.DataFrame) -> None:
+        """Test renaming a column changes the digest."""
+        renamed = sample_df.rename(columns={"genre": "category"})
+        assert frame_digest(renamed) != frame_digest(sample_df)
+
+
+class TestEnsureDir:
+    """Test directory creation."""
+
+    def test_creates_nested_dir(self, tmp_path: Path) -> None:
+        """Test missing parents are created."""
+        path = tmp_path / "a" / "b"
+        assert ensure_dir(path) == path
+        assert path.is_dir()
+
+    def test_recreates_removed_dir(self, tmp_path: Path) -> None:
+        """Test a directory removed after an earlier call is created again."""
+        path = tmp_path / "out"
+        ensure_dir(path)
+        path.rmdir()
+        ensure_dir(path)
+        assert path.is_dir()